@@ -5,6 +5,7 @@ Orchestrates plan parsing, scheduling, Garmin sync, and AI evaluation.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta, datetime
 from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
@@ -41,6 +42,9 @@ class TrainingPlanManager:
 
     PLAN_PATH = "plans/base_training_plan.md"
 
+    # Concurrent Garmin upload+schedule round-trips during a sync
+    GARMIN_SYNC_WORKERS = 4
+
     def __init__(self, db: Session, athlete_id: int):
         self.db = db
         self.athlete_id = athlete_id
@@ -201,44 +205,66 @@ class TrainingPlanManager:
                 ScheduledWorkout.garmin_workout_id.is_(None)
             ).all()
 
+        # Convert every workout first so the uploads below can overlap
+        pending = []
         for scheduled in workouts:
             try:
-                # Convert to Garmin workout
                 garmin_workout = self._create_garmin_workout(scheduled)
-                if garmin_workout:
-                    # Upload and schedule (handles both dict and GarminWorkout types)
-                    workout_id, success = self._upload_and_schedule_garmin_workout(
+            except Exception as e:
+                results["failed"].append({
+                    "date": scheduled.scheduled_date.isoformat(),
+                    "type": scheduled.workout_type,
+                    "error": str(e)
+                })
+                continue
+
+            if garmin_workout:
+                pending.append((scheduled, garmin_workout))
+            else:
+                results["skipped"].append({
+                    "date": scheduled.scheduled_date.isoformat(),
+                    "type": scheduled.workout_type,
+                    "reason": "Could not create Garmin workout format"
+                })
+
+        if pending:
+            # Upload and schedule concurrently (handles both dict and GarminWorkout
+            # types); results are applied here, since the session isn't thread-safe
+            with ThreadPoolExecutor(max_workers=min(self.GARMIN_SYNC_WORKERS, len(pending))) as executor:
+                futures = [
+                    executor.submit(
+                        self._upload_and_schedule_garmin_workout,
                         garmin_workout, scheduled.scheduled_date
                     )
+                    for scheduled, garmin_workout in pending
+                ]
 
-                    if workout_id:
-                        scheduled.garmin_workout_id = workout_id
-                        scheduled.garmin_calendar_date = scheduled.scheduled_date
-                        self.db.commit()
-                        results["synced"].append({
-                            "date": scheduled.scheduled_date.isoformat(),
-                            "type": scheduled.workout_type,
-                            "garmin_id": workout_id
-                        })
-                    else:
+                for (scheduled, _), future in zip(pending, futures):
+                    try:
+                        workout_id, success = future.result()
+
+                        if workout_id:
+                            scheduled.garmin_workout_id = workout_id
+                            scheduled.garmin_calendar_date = scheduled.scheduled_date
+                            self.db.commit()
+                            results["synced"].append({
+                                "date": scheduled.scheduled_date.isoformat(),
+                                "type": scheduled.workout_type,
+                                "garmin_id": workout_id
+                            })
+                        else:
+                            results["failed"].append({
+                                "date": scheduled.scheduled_date.isoformat(),
+                                "type": scheduled.workout_type,
+                                "error": "Failed to upload"
+                            })
+
+                    except Exception as e:
                         results["failed"].append({
                             "date": scheduled.scheduled_date.isoformat(),
                             "type": scheduled.workout_type,
-                            "error": "Failed to upload"
+                            "error": str(e)
                         })
-                else:
-                    results["skipped"].append({
-                        "date": scheduled.scheduled_date.isoformat(),
-                        "type": scheduled.workout_type,
-                        "reason": "Could not create Garmin workout format"
-                    })
-
-            except Exception as e:
-                results["failed"].append({
-                    "date": scheduled.scheduled_date.isoformat(),
-                    "type": scheduled.workout_type,
-                    "error": str(e)
-                })
 
         # After syncing new workouts, scan ALL existing workouts for format issues
         try:
@@ -20,6 +20,7 @@ from typing import Optional
 from api.timezone import get_eastern_today, get_eastern_now
 from database.base import SessionLocal
 from database.models import CronLog
+from integrations.garmin.client import GarminClient
 from integrations.garmin.activity_importer import GarminActivityImporter
 from integrations.garmin.wellness_importer import GarminWellnessImporter
 from integrations.hevy.activity_importer import HevyActivityImporter
@@ -88,36 +89,45 @@ async def cron_sync(
     try:
         start_time = time.time()
 
-        # Sync Garmin activities
+        # One authenticated Garmin session shared by the activity and wellness importers;
+        # if it can't be built, both are skipped instead of each retrying the login
+        garmin_client = None
         try:
-            garmin = GarminActivityImporter(db, athlete_id)
-            imported, skipped, errors = garmin.import_recent_activities(days)
-            results["garmin_activities"] = {
-                "imported": imported,
-                "skipped": skipped,
-                "errors": errors
-            }
-            if errors:
-                results["errors"].extend([f"Garmin Activities: {e}" for e in errors])
-        except Exception as e:
-            results["garmin_activities"] = {"imported": 0, "skipped": 0, "errors": [str(e)]}
-            results["errors"].append(f"Garmin activities sync failed: {str(e)}")
-
-        # Sync Garmin wellness data (sleep, stress, HRV, body battery, etc.)
-        try:
-            wellness = GarminWellnessImporter(db, athlete_id)
-            imported, updated, errors = wellness.import_recent_wellness(days)
-            wellness.update_athlete_metrics()
-            results["garmin_wellness"] = {
-                "imported": imported,
-                "updated": updated,
-                "errors": errors
-            }
-            if errors:
-                results["errors"].extend([f"Garmin Wellness: {e}" for e in errors])
+            garmin_client = GarminClient()
         except Exception as e:
-            results["garmin_wellness"] = {"imported": 0, "updated": 0, "errors": [str(e)]}
-            results["errors"].append(f"Garmin wellness sync failed: {str(e)}")
+            results["errors"].append(f"Garmin client unavailable: {str(e)}")
+
+        if garmin_client is not None:
+            # Sync Garmin activities
+            try:
+                garmin = GarminActivityImporter(db, athlete_id, client=garmin_client)
+                imported, skipped, errors = garmin.import_recent_activities(days)
+                results["garmin_activities"] = {
+                    "imported": imported,
+                    "skipped": skipped,
+                    "errors": errors
+                }
+                if errors:
+                    results["errors"].extend([f"Garmin Activities: {e}" for e in errors])
+            except Exception as e:
+                results["garmin_activities"] = {"imported": 0, "skipped": 0, "errors": [str(e)]}
+                results["errors"].append(f"Garmin activities sync failed: {str(e)}")
+
+            # Sync Garmin wellness data (sleep, stress, HRV, body battery, etc.)
+            try:
+                wellness = GarminWellnessImporter(db, athlete_id, client=garmin_client)
+                imported, updated, errors = wellness.import_recent_wellness(days)
+                wellness.update_athlete_metrics()
+                results["garmin_wellness"] = {
+                    "imported": imported,
+                    "updated": updated,
+                    "errors": errors
+                }
+                if errors:
+                    results["errors"].extend([f"Garmin Wellness: {e}" for e in errors])
+            except Exception as e:
+                results["garmin_wellness"] = {"imported": 0, "updated": 0, "errors": [str(e)]}
+                results["errors"].append(f"Garmin wellness sync failed: {str(e)}")
 
         # Sync Hevy workouts
         try:
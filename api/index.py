@@ -1112,29 +1112,38 @@ class handler(BaseHTTPRequestHandler):
         except Exception as e:
             results["errors"].append(f"Table creation: {str(e)}")
 
-        # Sync Garmin activities
+        # One Garmin login shared by the activity and wellness importers
+        garmin_client = None
         try:
-            from integrations.garmin.activity_importer import GarminActivityImporter
-            garmin = GarminActivityImporter(db, athlete_id)
-            imported, skipped, errors = garmin.import_recent_activities(days)
-            results["garmin_activities"] = {"imported": imported, "skipped": skipped}
-            if errors:
-                results["errors"].extend(errors)
+            from integrations.garmin.client import GarminClient
+            garmin_client = GarminClient()
         except Exception as e:
-            results["garmin_activities"] = {"error": str(e)}
-            results["errors"].append(f"Garmin activities: {str(e)}")
+            results["errors"].append(f"Garmin client: {str(e)}")
 
-        # Sync Garmin wellness data
-        try:
-            from integrations.garmin.wellness_importer import GarminWellnessImporter
-            wellness = GarminWellnessImporter(db, athlete_id)
-            imported, updated, errors = wellness.import_recent_wellness(days)
-            results["garmin_wellness"] = {"imported": imported, "updated": updated}
-            if errors:
-                results["errors"].extend(errors)
-        except Exception as e:
-            results["garmin_wellness"] = {"error": str(e)}
-            results["errors"].append(f"Garmin wellness: {str(e)}")
+        if garmin_client is not None:
+            # Sync Garmin activities
+            try:
+                from integrations.garmin.activity_importer import GarminActivityImporter
+                garmin = GarminActivityImporter(db, athlete_id, client=garmin_client)
+                imported, skipped, errors = garmin.import_recent_activities(days)
+                results["garmin_activities"] = {"imported": imported, "skipped": skipped}
+                if errors:
+                    results["errors"].extend(errors)
+            except Exception as e:
+                results["garmin_activities"] = {"error": str(e)}
+                results["errors"].append(f"Garmin activities: {str(e)}")
+
+            # Sync Garmin wellness data
+            try:
+                from integrations.garmin.wellness_importer import GarminWellnessImporter
+                wellness = GarminWellnessImporter(db, athlete_id, client=garmin_client)
+                imported, updated, errors = wellness.import_recent_wellness(days)
+                results["garmin_wellness"] = {"imported": imported, "updated": updated}
+                if errors:
+                    results["errors"].extend(errors)
+            except Exception as e:
+                results["garmin_wellness"] = {"error": str(e)}
+                results["errors"].append(f"Garmin wellness: {str(e)}")
 
         # Sync Hevy workouts
         try:
@@ -9,6 +9,7 @@ from datetime import date, timedelta
 from database.base import get_db
 from api.schemas import ImportRequest, ImportResponse
 from integrations.garmin.activity_importer import GarminActivityImporter
+from integrations.garmin.client import GarminClient
 from integrations.hevy.activity_importer import HevyActivityImporter
 
 router = APIRouter(prefix="/import", tags=["import"])
@@ -177,7 +178,7 @@ def sync_all_sources(
 
     # Import from Garmin
     try:
-        garmin_importer = GarminActivityImporter(db, athlete_id)
+        garmin_importer = GarminActivityImporter(db, athlete_id, client=GarminClient())
         garmin_imported, garmin_skipped, garmin_errors = garmin_importer.import_recent_activities(days)
         results["sources"]["garmin"] = {
             "imported": garmin_imported,
@@ -16,6 +16,7 @@ from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
     Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from database.base import Base
@@ -372,7 +373,8 @@ class DailyWellness(Base):
     __tablename__ = "daily_wellness"
     __table_args__ = (
         UniqueConstraint("athlete_id", "date", name="uix_wellness_athlete_date"),
-        Index("idx_wellness_date", "athlete_id", "date"),
+        # Descending date so "latest wellness for athlete" is a single index seek
+        Index("idx_wellness_athlete_date_desc", "athlete_id", text("date DESC")),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -426,6 +428,8 @@ class DailyWellness(Base):
 
     # Raw data storage for additional fields
     raw_data_json = Column(Text)  # Full JSON response for future use
+    raw_data_hash = Column(String(32))  # MD5 of raw_data_json, skips rewriting the blob
+    content_hash = Column(String(32))  # MD5 of parsed fields, skips no-op re-imports
 
     # Tracking
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -18,17 +18,19 @@ class GarminActivityImporter:
     Imports activities from Garmin Connect into the database.
     """
 
-    def __init__(self, db: Session, athlete_id: int):
+    def __init__(self, db: Session, athlete_id: int, client: Optional[GarminClient] = None):
         """
         Initialize importer.
 
         Args:
             db: Database session
             athlete_id: ID of athlete to import activities for
+            client: Optional already-constructed GarminClient to share its
+                authenticated session across importers (avoids a second login)
         """
         self.db = db
         self.athlete_id = athlete_id
-        self.client = GarminClient()
+        self.client = client or GarminClient()
 
         # Verify athlete exists
         athlete = db.query(Athlete).filter(Athlete.id == athlete_id).first()
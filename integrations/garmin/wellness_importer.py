@@ -3,33 +3,65 @@ Garmin wellness data importer.
 Syncs sleep, stress, HRV, body battery, and training metrics.
 """
 
-import json
+import hashlib
 from datetime import date, timedelta
+from enum import IntEnum
 from typing import Optional, Dict, Any, Tuple
+from sqlalchemy import insert, literal, select
 from sqlalchemy.orm import Session
 
 from integrations.garmin.client import GarminClient
+from integrations.serialization import to_json
 from database.models import DailyWellness, Athlete, ProgressMetric
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Column names on DailyWellness; parsed keys outside this set are never written
+_WELLNESS_COLUMNS = frozenset(c.name for c in DailyWellness.__table__.columns)
+
+# Below this many body battery readings the plain Python path beats NumPy's setup cost
+_BODY_BATTERY_NUMPY_THRESHOLD = 256
+
+
+class ImportStatus(IntEnum):
+    """Outcome of importing wellness data for a single date."""
+    CREATED = 1
+    UPDATED = 2
+    NOCHANGE = 3
+    ERROR = 4
+
 
 class GarminWellnessImporter:
     """
     Import wellness data from Garmin Connect into the database.
     """
 
-    def __init__(self, db: Session, athlete_id: int):
+    def __init__(self, db: Session, athlete_id: int, client: Optional[GarminClient] = None):
+        """
+        Initialize importer.
+
+        Args:
+            db: Database session
+            athlete_id: ID of athlete to import wellness data for
+            client: Optional already-constructed GarminClient to share its
+                authenticated session across importers (avoids a second login)
+        """
         self.db = db
         self.athlete_id = athlete_id
-        self.client = GarminClient()
+        self.client = client or GarminClient()
 
-    def import_wellness_for_date(self, target_date: date) -> Tuple[bool, str]:
+    def import_wellness_for_date(self, target_date: date) -> Tuple[ImportStatus, str]:
         """
         Import all wellness data for a specific date.
 
         Returns:
-            Tuple of (success, message)
+            Tuple of (status, message)
         """
-        date_str = target_date.strftime("%Y-%m-%d")
+        date_str = target_date.isoformat()
 
         # Check if already imported
         existing = self.db.query(DailyWellness).filter(
@@ -59,27 +91,54 @@ class GarminWellnessImporter:
                 max_metrics, user_summary
             )
 
+            # The raw payload blob is tracked by its own hash so the (large)
+            # column is only rewritten when the Garmin response actually changed
+            raw_data_json = wellness_data.pop("raw_data_json")
+            raw_data_hash = self._digest(raw_data_json)
+            content_hash = self._digest(to_json(wellness_data, sort_keys=True))
+
             if existing:
-                # Update existing record
-                for key, value in wellness_data.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
+                raw_changed = existing.raw_data_hash != raw_data_hash
+
+                # Skip the write entirely when nothing changed since last import
+                if existing.content_hash == content_hash and not raw_changed:
+                    return ImportStatus.NOCHANGE, f"No change in wellness for {date_str}"
+
+                # Update existing record with a single UPDATE of only the
+                # listed columns, bypassing per-attribute unit-of-work tracking
+                changes = {
+                    key: value for key, value in wellness_data.items()
+                    if key in _WELLNESS_COLUMNS
+                }
+                changes["content_hash"] = content_hash
+                if raw_changed:
+                    changes["raw_data_json"] = raw_data_json
+                    changes["raw_data_hash"] = raw_data_hash
+                self.db.bulk_update_mappings(DailyWellness, [{"id": existing.id, **changes}])
                 self.db.commit()
-                return True, f"Updated wellness for {date_str}"
+                return ImportStatus.UPDATED, f"Updated wellness for {date_str}"
             else:
                 # Create new record
                 wellness = DailyWellness(
                     athlete_id=self.athlete_id,
                     date=target_date,
+                    content_hash=content_hash,
+                    raw_data_json=raw_data_json,
+                    raw_data_hash=raw_data_hash,
                     **wellness_data
                 )
                 self.db.add(wellness)
                 self.db.commit()
-                return True, f"Imported wellness for {date_str}"
+                return ImportStatus.CREATED, f"Imported wellness for {date_str}"
 
         except Exception as e:
             self.db.rollback()
-            return False, f"Error importing wellness for {date_str}: {str(e)}"
+            return ImportStatus.ERROR, f"Error importing wellness for {date_str}: {str(e)}"
+
+    @staticmethod
+    def _digest(payload: str) -> str:
+        """32-char hex digest of a serialized payload, used to detect no-op re-imports."""
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()
 
     def _parse_wellness_data(
         self, target_date: date, sleep: Dict, stress: Dict, body_battery: Any,
@@ -107,7 +166,17 @@ class GarminWellnessImporter:
             if isinstance(bb_day, dict):
                 # Extract values from bodyBatteryValuesArray [[timestamp, level], ...]
                 values_array = bb_day.get("bodyBatteryValuesArray", [])
-                if values_array:
+                if NUMPY_AVAILABLE and len(values_array) > _BODY_BATTERY_NUMPY_THRESHOLD:
+                    levels = np.fromiter(
+                        (v[1] for v in values_array if isinstance(v, list) and len(v) > 1),
+                        dtype=np.int32,
+                    )
+                    if levels.size:
+                        data["body_battery_high"] = int(levels.max())
+                        data["body_battery_low"] = int(levels.min())
+                        # Current is the most recent reading (last in array)
+                        data["body_battery_current"] = int(levels[-1])
+                elif values_array:
                     bb_values = [v[1] for v in values_array if isinstance(v, list) and len(v) > 1]
                     if bb_values:
                         data["body_battery_high"] = max(bb_values)
@@ -153,16 +222,20 @@ class GarminWellnessImporter:
         if spo2:
             data["avg_spo2"] = spo2.get("avgSleepSpo2") or spo2.get("latestSpo2Value")
 
-        # Steps and activity (steps may be a list of intervals)
+        # Steps and activity (steps may be a list of intervals); the daily
+        # summary total is the fallback when the steps endpoint has nothing
+        steps_val = None
         if steps:
             if isinstance(steps, list):
                 # Sum steps from all intervals
-                total_steps = sum(s.get("steps", 0) for s in steps if isinstance(s, dict))
-                data["steps"] = total_steps if total_steps > 0 else None
+                steps_val = sum(s.get("steps", 0) for s in steps if isinstance(s, dict)) or None
             elif isinstance(steps, dict):
-                data["steps"] = steps.get("totalSteps")
+                steps_val = steps.get("totalSteps")
+        if user_summary:
+            steps_val = steps_val or user_summary.get("totalSteps")
+        if steps or user_summary:
+            data["steps"] = steps_val
         if user_summary:
-            data["steps"] = data.get("steps") or user_summary.get("totalSteps")
             data["floors_climbed"] = user_summary.get("floorsAscended")
             data["active_calories"] = user_summary.get("activeKilocalories")
             data["total_calories"] = user_summary.get("totalKilocalories")
@@ -192,7 +265,7 @@ class GarminWellnessImporter:
             "training_status": training_status,
             "max_metrics": max_metrics,
         }
-        data["raw_data_json"] = json.dumps(raw_data, default=str)
+        data["raw_data_json"] = to_json(raw_data)
 
         return data
 
@@ -211,15 +284,14 @@ class GarminWellnessImporter:
 
         for i in range(days):
             target_date = today - timedelta(days=i)
-            success, message = self.import_wellness_for_date(target_date)
+            status, message = self.import_wellness_for_date(target_date)
 
-            if success:
-                if "Updated" in message:
-                    skipped += 1
-                else:
-                    imported += 1
-            else:
+            if status == ImportStatus.CREATED:
+                imported += 1
+            elif status == ImportStatus.ERROR:
                 errors.append(message)
+            else:
+                skipped += 1
 
         return imported, skipped, errors
 
@@ -243,22 +315,26 @@ class GarminWellnessImporter:
         if latest.vo2_max_running:
             athlete.current_vo2_max = int(latest.vo2_max_running)
 
-            # Also store as progress metric
-            existing_metric = self.db.query(ProgressMetric).filter(
+            # Also store as progress metric; the NOT EXISTS guard folds the
+            # existence check into the INSERT so this is a single round trip
+            already_recorded = select(ProgressMetric.id).where(
                 ProgressMetric.athlete_id == self.athlete_id,
                 ProgressMetric.metric_type == "vo2_max",
                 ProgressMetric.metric_date == latest.date
-            ).first()
-
-            if not existing_metric:
-                metric = ProgressMetric(
-                    athlete_id=self.athlete_id,
-                    metric_date=latest.date,
-                    metric_type="vo2_max",
-                    value_numeric=latest.vo2_max_running,
-                    measurement_method="garmin_estimate",
-                    notes="Auto-synced from Garmin"
+            ).exists()
+            self.db.execute(
+                insert(ProgressMetric).from_select(
+                    ["athlete_id", "metric_date", "metric_type", "value_numeric",
+                     "measurement_method", "notes"],
+                    select(
+                        literal(self.athlete_id),
+                        literal(latest.date),
+                        literal("vo2_max"),
+                        literal(latest.vo2_max_running),
+                        literal("garmin_estimate"),
+                        literal("Auto-synced from Garmin"),
+                    ).where(~already_recorded)
                 )
-                self.db.add(metric)
+            )
 
         self.db.commit()
@@ -6,13 +6,19 @@ API format discovered by inspecting actual Garmin workouts - the official
 garminconnect library doesn't fully support workout creation.
 """
 
+import copy
 import json
+import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 
 # Try to import garth for direct API access
 try:
@@ -22,31 +28,78 @@ except ImportError:
     GARTH_AVAILABLE = False
     garth = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from integrations.garmin.client import GarminClient
 
+logger = logging.getLogger(__name__)
+
+# Patterns for the plan-string parsers, compiled once at import. The numeric
+# parsers lowercase their input instead of matching with re.IGNORECASE; the
+# description patterns keep the flag because they echo free text back out.
+# Reps × value with optional range and unit: "4×50", "3x30-45s", "6×100yd"
+_SETS_RE = re.compile(r'(\d+)[×x](\d+(?:-\d+)?)(s|m|min|y|yd|yards?)?')
+# Count × seconds, either side may be a range: "4×20s", "3-4×15-20s", "4x20sec"
+_STRIDES_RE = re.compile(r'(\d+)(?:-(\d+))?[×x](\d+)(?:-(\d+))?\s*(s|sec|seconds?)?')
+# Sets × reps with an optional rep range: "3×8-10", "2x10"
+_SETS_AND_REPS_RE = re.compile(r'(\d+)[×x](\d+)(?:-(\d+))?')
+# Integer range ("15-20") or number ("20", "1.5"), then an optional time unit
+_TIME_RE = re.compile(r'(\d+)(?:-(\d+)|(\.\d+))?\s*(s|sec|seconds?|m|min|minutes?)?')
+# Swim main set "reps×distance @ intensity[, Ns rest]": "12×50 @ moderate-hard, 20s rest"
+_SWIM_SET_DESCRIPTION_RE = re.compile(r'(\d+)[×x](\d+)\s*@\s*([^,]+),?\s*(\d+s?\s*rest)?', re.IGNORECASE)
+# VO2 main set "reps×time[unit] @ intensity, rest[unit] [easy] between|rest":
+# "6×2 min @ hard (RPE 8), 2 min easy between"; units default to minutes
+_VO2_INTERVAL_RE = re.compile(
+    r'(\d+)[×x](\d+(?:\.\d+)?)\s*(min|s|sec)?\s*@\s*([^,]+),?\s*(\d+(?:\.\d+)?)\s*(min|s|sec)?\s*(?:easy\s+)?(?:between|rest)?',
+    re.IGNORECASE
+)
+
+# garth keeps its session in a module-level client, so token resume only has
+# to happen once per process no matter how many managers are created.
+_GARTH_READY = False
+_GARTH_LOCK = threading.Lock()
+
 
 class WorkoutStepType(Enum):
-    """Garmin workout step types."""
-    WARMUP = "warmup"
-    COOLDOWN = "cooldown"
-    INTERVAL = "interval"
-    RECOVERY = "recovery"
-    REST = "rest"
-    REPEAT = "repeat"
-    OTHER = "other"
+    """Garmin workout step types (value, Garmin stepTypeId)."""
+    WARMUP = ("warmup", 1)
+    COOLDOWN = ("cooldown", 2)
+    INTERVAL = ("interval", 3)
+    RECOVERY = ("recovery", 4)
+    REST = ("rest", 5)
+    REPEAT = ("repeat", 6)
+    OTHER = ("other", 7)
+
+    def __new__(cls, key: str, type_id: int):
+        obj = object.__new__(cls)
+        obj._value_ = key
+        # Garmin stepType payload, read directly off the member
+        obj.step_info = {"stepTypeId": type_id, "stepTypeKey": key, "displayOrder": type_id}
+        return obj
 
 
 class WorkoutSportType(Enum):
-    """Garmin sport types for workouts."""
-    RUNNING = "running"
-    CYCLING = "cycling"
-    SWIMMING = "swimming"
-    STRENGTH = "strength_training"
-    CARDIO = "cardio_training"
-    OTHER = "other"
-
-
-@dataclass
+    """Garmin sport types for workouts (value, Garmin sportTypeId, sportTypeKey, displayOrder)."""
+    RUNNING = ("running", 1, "running", 1)
+    CYCLING = ("cycling", 2, "cycling", 2)
+    SWIMMING = ("swimming", 4, "swimming", 3)
+    STRENGTH = ("strength_training", 5, "strength_training", 5)
+    CARDIO = ("cardio_training", 1, "running", 1)  # VO2 uses running
+    OTHER = ("other", 0, "other", 0)
+
+    def __new__(cls, value: str, type_id: int, type_key: str, display_order: int):
+        obj = object.__new__(cls)
+        obj._value_ = value
+        # Garmin sportType payload (correct mappings discovered from actual API responses)
+        obj.sport_info = {"sportTypeId": type_id, "sportTypeKey": type_key, "displayOrder": display_order}
+        return obj
+
+
+@dataclass(slots=True, frozen=True)
 class WorkoutStep:
     """A single step in a Garmin workout."""
     type: WorkoutStepType
@@ -55,23 +108,161 @@ class WorkoutStep:
     target_type: Optional[str] = None  # "heart_rate", "pace", "power", "cadence", "open"
     target_value_low: Optional[float] = None
     target_value_high: Optional[float] = None
-    description: Optional[str] = None
+    description: str = ""
     repeat_count: Optional[int] = None  # For repeat steps
     child_steps: Optional[List['WorkoutStep']] = None
 
+    def __post_init__(self):
+        # Normalize once here so serialization can use the fields as-is
+        # (object.__setattr__ because the dataclass is frozen)
+        if self.duration_value is not None and type(self.duration_value) is not float:
+            object.__setattr__(self, "duration_value", float(self.duration_value))
+        if self.description is None:
+            object.__setattr__(self, "description", "")
+
+    def _as_key(self) -> Tuple:
+        """Hashable fingerprint of every field that affects the Garmin format."""
+        return (
+            self.type, self.duration_type, self.duration_value, self.target_type,
+            self.target_value_low, self.target_value_high, self.description,
+            self.repeat_count,
+            tuple(child._as_key() for child in self.child_steps) if self.child_steps else None,
+        )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GarminWorkout:
     """A Garmin workout definition."""
     name: str
     sport_type: WorkoutSportType
     description: Optional[str] = None
-    steps: List[WorkoutStep] = None
+    steps: List[WorkoutStep] = field(default_factory=list)
     estimated_duration_minutes: Optional[int] = None
 
-    def __post_init__(self):
-        if self.steps is None:
-            self.steps = []
+    def _as_key(self) -> Tuple:
+        """Hashable fingerprint of the workout, used to memoize its Garmin format."""
+        return (
+            self.name, self.sport_type, self.description, self.estimated_duration_minutes,
+            tuple(step._as_key() for step in self.steps),
+        )
+
+
+# Shared sub-dicts for executable steps. These, the enum step_info/sport_info
+# payloads and the class condition maps are only ever serialized, never
+# mutated, so every step can reference the same objects. Output of the
+# create_detailed_* builders shares them and should be treated as read-only;
+# workout_to_garmin_format hands out copies (see _copy_workout_json).
+_NO_TARGET = {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1}
+_STROKE_SWIM = {"strokeTypeId": 6, "strokeTypeKey": "free", "displayOrder": 6}
+_STROKE_NONE = {"strokeTypeId": 0, "strokeTypeKey": None, "displayOrder": 0}
+_EQUIPMENT_NONE = {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0}
+
+# WorkoutStep.target_type -> Garmin target type ("open" and None mean no target)
+_TARGET_TYPE_MAP = {
+    "heart_rate": {"workoutTargetTypeId": 4, "workoutTargetTypeKey": "heart.rate.zone"},
+    "pace": {"workoutTargetTypeId": 2, "workoutTargetTypeKey": "pace.zone"},
+    "power": {"workoutTargetTypeId": 3, "workoutTargetTypeKey": "power.zone"},
+    "cadence": {"workoutTargetTypeId": 5, "workoutTargetTypeKey": "cadence"},
+}
+
+# ExecutableStepDTO with every field at its default; copied once per step
+_EXEC_STEP_TEMPLATE = {
+    "type": "ExecutableStepDTO",
+    "stepOrder": None,
+    "stepType": None,
+    "childStepId": None,
+    "description": "",
+    "endCondition": None,
+    "endConditionValue": None,
+    "preferredEndConditionUnit": None,
+    "endConditionCompare": None,
+    "targetType": _NO_TARGET,
+    "targetValueOne": None,
+    "targetValueTwo": None,
+    "targetValueUnit": None,
+    "zoneNumber": None,
+    "secondaryTargetType": None,
+    "secondaryTargetValueOne": None,
+    "secondaryTargetValueTwo": None,
+    "secondaryTargetValueUnit": None,
+    "secondaryZoneNumber": None,
+    "endConditionZone": None,
+    "strokeType": _STROKE_NONE,
+    "equipmentType": _EQUIPMENT_NONE,
+    "category": None,
+    "exerciseName": None,
+    "workoutProvider": None,
+    "providerExerciseSourceId": None,
+    "weightValue": None,
+    "weightUnit": None
+}
+
+# Swim variant of the template, so per-step code doesn't branch on sport
+_SWIM_STEP_TEMPLATE = {**_EXEC_STEP_TEMPLATE, "strokeType": _STROKE_SWIM}
+
+# The single workout segment every builder emits, with its defaults
+_SEGMENT_TEMPLATE = {
+    "segmentOrder": 1,
+    "sportType": None,
+    "poolLengthUnit": None,
+    "poolLength": None,
+    "avgTrainingSpeed": None,
+    "estimatedDurationInSecs": None,
+    "estimatedDistanceInMeters": None,
+    "estimatedDistanceUnit": None,
+    "estimateType": None,
+    "description": None,
+    "workoutSteps": None
+}
+
+
+def _json_body(payload: Any) -> Dict[str, Any]:
+    """
+    Request kwargs for a JSON body.
+
+    With orjson installed the payload is encoded in C and sent as raw bytes;
+    otherwise requests encodes it with the stdlib json module.
+    """
+    if ORJSON_AVAILABLE:
+        # garth adds the Authorization header to this dict, so build a new one per call
+        return {"data": orjson.dumps(payload), "headers": {"Content-Type": "application/json"}}
+    return {"json": payload}
+
+
+def _ensure_garth_pool(workers: int) -> None:
+    """
+    Grow garth's connection pool to fit a batch of concurrent requests.
+
+    garth sends every call through one keep-alive requests.Session. When more
+    threads share it than the pool holds, urllib3 drops the surplus
+    connections after each request and the next ones pay a fresh TLS
+    handshake.
+    """
+    if workers > garth.client.pool_maxsize:
+        garth.configure(pool_connections=workers, pool_maxsize=workers)
+
+
+def _copy_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a dict along with its dict-valued fields (stepType, targetType, ...)."""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in payload.items()}
+
+
+def _copy_workout_json(workout_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a rendered workout down to the step payloads so callers can edit it freely."""
+    copied = _copy_payload(workout_json)
+    copied["workoutSegments"] = [
+        {**_copy_payload(segment), "workoutSteps": [_copy_payload(step) for step in segment["workoutSteps"]]}
+        for segment in workout_json["workoutSegments"]
+    ]
+    return copied
+
+
+def _walk_steps(steps: List[WorkoutStep]) -> Iterator[WorkoutStep]:
+    """Yield steps in Garmin order, with repeat children inlined after their parent."""
+    for step in steps:
+        yield step
+        if step.child_steps:
+            yield from step.child_steps
 
 
 class GarminWorkoutManager:
@@ -82,26 +273,9 @@ class GarminWorkoutManager:
     fully support workout creation/scheduling.
     """
 
-    # Correct Garmin sport type mappings (discovered from actual API responses)
-    SPORT_TYPE_MAP = {
-        WorkoutSportType.RUNNING: {"sportTypeId": 1, "sportTypeKey": "running", "displayOrder": 1},
-        WorkoutSportType.CYCLING: {"sportTypeId": 2, "sportTypeKey": "cycling", "displayOrder": 2},
-        WorkoutSportType.SWIMMING: {"sportTypeId": 4, "sportTypeKey": "swimming", "displayOrder": 3},
-        WorkoutSportType.STRENGTH: {"sportTypeId": 5, "sportTypeKey": "strength_training", "displayOrder": 5},
-        WorkoutSportType.CARDIO: {"sportTypeId": 1, "sportTypeKey": "running", "displayOrder": 1},  # VO2 uses running
-        WorkoutSportType.OTHER: {"sportTypeId": 0, "sportTypeKey": "other", "displayOrder": 0},
-    }
-
-    # Step type mappings
-    STEP_TYPE_MAP = {
-        WorkoutStepType.WARMUP: {"stepTypeId": 1, "stepTypeKey": "warmup", "displayOrder": 1},
-        WorkoutStepType.COOLDOWN: {"stepTypeId": 2, "stepTypeKey": "cooldown", "displayOrder": 2},
-        WorkoutStepType.INTERVAL: {"stepTypeId": 3, "stepTypeKey": "interval", "displayOrder": 3},
-        WorkoutStepType.RECOVERY: {"stepTypeId": 4, "stepTypeKey": "recovery", "displayOrder": 4},
-        WorkoutStepType.REST: {"stepTypeId": 5, "stepTypeKey": "rest", "displayOrder": 5},
-        WorkoutStepType.REPEAT: {"stepTypeId": 6, "stepTypeKey": "repeat", "displayOrder": 6},
-        WorkoutStepType.OTHER: {"stepTypeId": 7, "stepTypeKey": "other", "displayOrder": 7},
-    }
+    # Garmin sport/step payloads keyed by enum member (the members carry them too)
+    SPORT_TYPE_MAP = {sport: sport.sport_info for sport in WorkoutSportType}
+    STEP_TYPE_MAP = {step_type: step_type.step_info for step_type in WorkoutStepType}
 
     # End condition mappings
     CONDITION_TYPE_MAP = {
@@ -116,13 +290,45 @@ class GarminWorkoutManager:
     # Pool length unit for swimming (25 yards)
     POOL_LENGTH_UNIT = {"unitId": 230, "unitKey": "yard", "factor": 91.44}
 
+    # Maximum number of rendered workouts memoized by workout_to_garmin_format
+    FORMAT_CACHE_SIZE = 256
+
+    # Read-through cache lifetimes (seconds) for Garmin GET endpoints
+    WORKOUTS_CACHE_TTL = 30
+    CALENDAR_CACHE_TTL = 300
+
     # Fixed rest condition
     FIXED_REST_CONDITION = {"conditionTypeId": 8, "conditionTypeKey": "fixed.rest", "displayOrder": 8, "displayable": True}
 
     # Iterations condition for repeat groups
     ITERATIONS_CONDITION = {"conditionTypeId": 7, "conditionTypeKey": "iterations", "displayOrder": 7, "displayable": False}
 
+    # Step type keys accepted by the detailed swim, strength and cardio step builders,
+    # mapped to the stepType payload carried by the matching enum member
+    _SWIM_STEP_TYPE_MAP = {
+        step_type.value: step_type.step_info
+        for step_type in (
+            WorkoutStepType.INTERVAL, WorkoutStepType.WARMUP,
+            WorkoutStepType.COOLDOWN, WorkoutStepType.RECOVERY,
+        )
+    }
+    _STRENGTH_STEP_TYPE_MAP = {
+        step_type.value: step_type.step_info
+        for step_type in (
+            WorkoutStepType.WARMUP, WorkoutStepType.COOLDOWN, WorkoutStepType.INTERVAL,
+            WorkoutStepType.REST, WorkoutStepType.OTHER,
+        )
+    }
+    _CARDIO_STEP_TYPE_MAP = {
+        step_type.value: step_type.step_info
+        for step_type in (
+            WorkoutStepType.INTERVAL, WorkoutStepType.WARMUP,
+            WorkoutStepType.COOLDOWN, WorkoutStepType.RECOVERY, WorkoutStepType.OTHER,
+        )
+    }
+
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_sets_string(sets_str: str) -> Tuple[Optional[int], Optional[float], Optional[str]]:
         """
         Parse a sets string like "4×50" or "3×8-10" or "2×30s".
@@ -134,7 +340,7 @@ class GarminWorkoutManager:
             return None, None, None
 
         # Match patterns like "4×50", "3x8-10", "2×30s"
-        match = re.match(r'(\d+)[×x](\d+(?:-\d+)?)(s|m|min|y|yd|yards?)?', sets_str, re.IGNORECASE)
+        match = _SETS_RE.match(sets_str.lower())
         if match:
             reps = int(match.group(1))
             value_str = match.group(2)
@@ -148,11 +354,11 @@ class GarminWorkoutManager:
                 value = float(value_str)
 
             # Determine unit type
-            if unit_suffix and unit_suffix.lower() in ('s', 'm', 'min'):
+            if unit_suffix in ('s', 'm', 'min'):
                 unit = "time"
-                if unit_suffix.lower() in ('m', 'min'):
+                if unit_suffix in ('m', 'min'):
                     value *= 60  # Convert minutes to seconds
-            elif unit_suffix and unit_suffix.lower() in ('y', 'yd', 'yard', 'yards'):
+            elif unit_suffix in ('y', 'yd', 'yard', 'yards'):
                 unit = "distance"
             else:
                 # Default: if value > 20, assume distance in yards; else assume reps
@@ -163,6 +369,7 @@ class GarminWorkoutManager:
         return None, None, None
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_strides_string(strides_str: str) -> Tuple[Optional[int], Optional[float]]:
         """
         Parse a strides string like "4×20s" or "3-4×15-20s".
@@ -179,11 +386,7 @@ class GarminWorkoutManager:
             return None, None
 
         # Match patterns like "4×20s", "3-4×15-20s", "4x20sec"
-        match = re.match(
-            r'(\d+)(?:-(\d+))?[×x](\d+)(?:-(\d+))?\s*(s|sec|seconds?)?',
-            strides_str,
-            re.IGNORECASE
-        )
+        match = _STRIDES_RE.match(strides_str.lower())
         if match:
             # Parse number of strides (handle range)
             strides_low = int(match.group(1))
@@ -200,6 +403,7 @@ class GarminWorkoutManager:
         return None, None
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_rest_string(rest_str: str) -> Optional[float]:
         """
         Parse a rest string like "15-20s" or "20s" or "2 min" or "45-60s".
@@ -210,29 +414,23 @@ class GarminWorkoutManager:
         if not rest_str:
             return None
 
-        # Handle ranges like "15-20s" or "45-60s"
-        range_match = re.match(r'(\d+)-(\d+)\s*(s|sec|seconds?|m|min|minutes?)?', rest_str, re.IGNORECASE)
-        if range_match:
-            low = int(range_match.group(1))
-            high = int(range_match.group(2))
-            unit = range_match.group(3) or 's'
-            avg = (low + high) / 2
-            if unit.lower() in ('m', 'min', 'minute', 'minutes'):
-                return avg * 60
-            return avg
-
-        # Handle single values like "20s" or "2 min"
-        single_match = re.match(r'(\d+(?:\.\d+)?)\s*(s|sec|seconds?|m|min|minutes?)?', rest_str, re.IGNORECASE)
-        if single_match:
-            value = float(single_match.group(1))
-            unit = single_match.group(2) or 's'
-            if unit.lower() in ('m', 'min', 'minute', 'minutes'):
+        # One match handles ranges like "15-20s" and single values like "2 min"
+        match = _TIME_RE.match(rest_str.lower())
+        if match:
+            low, high, fraction, unit = match.groups()
+            if high:
+                value = (int(low) + int(high)) / 2
+            else:
+                value = float(low + fraction) if fraction else float(low)
+            unit = unit or 's'
+            if unit in ('m', 'min', 'minute', 'minutes'):
                 return value * 60
             return value
 
         return None
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_distance_string(distance_str: str) -> Optional[float]:
         """
         Parse a distance string like "300 yards" or "200y" or "400".
@@ -243,16 +441,25 @@ class GarminWorkoutManager:
         if not distance_str:
             return None
 
-        # Match patterns like "300 yards", "200y", "400"
-        match = re.match(r'(\d+(?:\.\d+)?)\s*(y|yd|yards?|m|meters?)?', distance_str, re.IGNORECASE)
-        if match:
-            value = float(match.group(1))
-            # Assume yards if not specified (for swimming)
-            return value
+        # Scan the leading number of "300 yards", "200y", "400". The unit is
+        # ignored (always yards for swimming), so no regex is needed.
+        n = len(distance_str)
+        i = 0
+        while i < n and distance_str[i].isdecimal():
+            i += 1
+        if i == 0:
+            return None
 
-        return None
+        # Optional ".digits" fraction
+        if i + 1 < n and distance_str[i] == "." and distance_str[i + 1].isdecimal():
+            i += 2
+            while i < n and distance_str[i].isdecimal():
+                i += 1
+
+        return float(distance_str[:i])
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_duration_string(duration_str: str) -> Optional[float]:
         """
         Parse a duration string like "5 min" or "30s" or "5-8 min".
@@ -263,23 +470,16 @@ class GarminWorkoutManager:
         if not duration_str:
             return None
 
-        # Handle ranges like "5-8 min"
-        range_match = re.match(r'(\d+)-(\d+)\s*(s|sec|seconds?|m|min|minutes?)?', duration_str, re.IGNORECASE)
-        if range_match:
-            low = int(range_match.group(1))
-            high = int(range_match.group(2))
-            unit = range_match.group(3) or 'min'
-            avg = (low + high) / 2
-            if unit.lower() in ('m', 'min', 'minute', 'minutes'):
-                return avg * 60
-            return avg
-
-        # Handle single values
-        single_match = re.match(r'(\d+(?:\.\d+)?)\s*(s|sec|seconds?|m|min|minutes?)?', duration_str, re.IGNORECASE)
-        if single_match:
-            value = float(single_match.group(1))
-            unit = single_match.group(2) or 'min'
-            if unit.lower() in ('m', 'min', 'minute', 'minutes'):
+        # One match handles ranges like "5-8 min" and single values like "30s"
+        match = _TIME_RE.match(duration_str.lower())
+        if match:
+            low, high, fraction, unit = match.groups()
+            if high:
+                value = (int(low) + int(high)) / 2
+            else:
+                value = float(low + fraction) if fraction else float(low)
+            unit = unit or 'min'
+            if unit in ('m', 'min', 'minute', 'minutes'):
                 return value * 60
             return value
 
@@ -337,24 +537,17 @@ class GarminWorkoutManager:
         Returns:
             ExecutableStepDTO dictionary
         """
-        step_type_map = {
-            "interval": {"stepTypeId": 3, "stepTypeKey": "interval", "displayOrder": 3},
-            "warmup": {"stepTypeId": 1, "stepTypeKey": "warmup", "displayOrder": 1},
-            "cooldown": {"stepTypeId": 2, "stepTypeKey": "cooldown", "displayOrder": 2},
-            "recovery": {"stepTypeId": 4, "stepTypeKey": "recovery", "displayOrder": 4},
-        }
-
         return {
             "type": "ExecutableStepDTO",
             "stepOrder": step_order,
-            "stepType": step_type_map.get(step_type, step_type_map["interval"]),
+            "stepType": self._SWIM_STEP_TYPE_MAP.get(step_type, WorkoutStepType.INTERVAL.step_info),
             "childStepId": None,
             "description": description,
             "endCondition": self.CONDITION_TYPE_MAP["distance"],
             "endConditionValue": float(distance),
             "preferredEndConditionUnit": self.POOL_LENGTH_UNIT,
             "endConditionCompare": None,
-            "targetType": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
+            "targetType": _NO_TARGET,
             "targetValueOne": None,
             "targetValueTwo": None,
             "targetValueUnit": None,
@@ -365,8 +558,8 @@ class GarminWorkoutManager:
             "secondaryTargetValueUnit": None,
             "secondaryZoneNumber": None,
             "endConditionZone": None,
-            "strokeType": {"strokeTypeId": 6, "strokeTypeKey": "free", "displayOrder": 6},
-            "equipmentType": {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0},
+            "strokeType": _STROKE_SWIM,
+            "equipmentType": _EQUIPMENT_NONE,
             "category": None,
             "exerciseName": None,
             "workoutProvider": None,
@@ -395,14 +588,14 @@ class GarminWorkoutManager:
         return {
             "type": "ExecutableStepDTO",
             "stepOrder": step_order,
-            "stepType": {"stepTypeId": 5, "stepTypeKey": "rest", "displayOrder": 5},
+            "stepType": WorkoutStepType.REST.step_info,
             "childStepId": None,
             "description": description,
             "endCondition": self.FIXED_REST_CONDITION,
             "endConditionValue": float(rest_seconds),
             "preferredEndConditionUnit": None,
             "endConditionCompare": None,
-            "targetType": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
+            "targetType": _NO_TARGET,
             "targetValueOne": None,
             "targetValueTwo": None,
             "targetValueUnit": None,
@@ -413,8 +606,8 @@ class GarminWorkoutManager:
             "secondaryTargetValueUnit": None,
             "secondaryZoneNumber": None,
             "endConditionZone": None,
-            "strokeType": {"strokeTypeId": 6, "strokeTypeKey": "free", "displayOrder": 6},
-            "equipmentType": {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0},
+            "strokeType": _STROKE_SWIM,
+            "equipmentType": _EQUIPMENT_NONE,
             "category": None,
             "exerciseName": None,
             "workoutProvider": None,
@@ -423,6 +616,135 @@ class GarminWorkoutManager:
             "weightUnit": None
         }
 
+    @staticmethod
+    def _classify_exercise(exercise: Dict[str, Any]) -> int:
+        """
+        Classify an exercise dictionary by shape.
+
+        Returns:
+            Index into _EXERCISE_BUILDERS: 0 for a plain distance, 1 for a
+            sets-based exercise, 2 for the description fallback
+        """
+        if exercise.get("sets"):
+            return 1
+        if exercise.get("distance"):
+            return 0
+        return 2
+
+    def _build_distance_exercise(
+        self,
+        exercise: Dict[str, Any],
+        step_order: int,
+        step_type: str
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Build a single swim step for a plain distance exercise (e.g. "300 yards")."""
+        distance = self.parse_distance_string(exercise["distance"])
+        if not distance:
+            return [], step_order
+
+        step = self._create_swim_interval_step(
+            distance=distance,
+            step_order=step_order,
+            step_type=step_type,
+            description=exercise.get("name", "")
+        )
+        return [step], step_order + 1
+
+    def _build_sets_exercise(
+        self,
+        exercise: Dict[str, Any],
+        step_order: int,
+        step_type: str
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Build a repeat group for a sets-based exercise (e.g. "4×50")."""
+        reps, value, unit = self.parse_sets_string(exercise["sets"])
+        if not (reps and value and unit == "distance"):
+            return [], step_order
+
+        rest_seconds = self.parse_rest_string(exercise.get("rest", ""))
+        notes = exercise.get("notes")
+
+        # Create repeat group with interval + optional rest
+        interval_step = self._create_swim_interval_step(
+            distance=value,
+            step_order=1,
+            step_type="interval",
+            description=exercise.get("notes", exercise.get("name", ""))
+        )
+
+        if rest_seconds:
+            child_steps = [
+                interval_step,
+                self._create_rest_step(
+                    rest_seconds=rest_seconds,
+                    step_order=2,
+                    description=f"{int(rest_seconds)}s rest"
+                ),
+            ]
+            group_desc = f"{reps}×{int(value)}, {int(rest_seconds)}s rest"
+        else:
+            child_steps = [interval_step]
+            group_desc = f"{reps}×{int(value)}"
+
+        if notes:
+            group_desc += f" - {notes}"
+
+        repeat_group = self._create_repeat_group(
+            iterations=reps,
+            child_steps=child_steps,
+            step_order=step_order,
+            description=group_desc
+        )
+        return [repeat_group], step_order + 1
+
+    def _build_description_exercise(
+        self,
+        exercise: Dict[str, Any],
+        step_order: int,
+        step_type: str
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Build a repeat group from a main set description like "12×50 @ moderate-hard, 20s rest"."""
+        description = exercise.get("description", "")
+        match = _SWIM_SET_DESCRIPTION_RE.match(description) if description else None
+        if not match:
+            return [], step_order
+
+        reps = int(match.group(1))
+        distance = float(match.group(2))
+        intensity = match.group(3).strip()
+        rest_match = match.group(4)
+        rest_seconds = self.parse_rest_string(rest_match) if rest_match else 20.0
+
+        # Interval + rest
+        child_steps = [
+            self._create_swim_interval_step(
+                distance=distance,
+                step_order=1,
+                step_type="interval",
+                description=intensity
+            ),
+            self._create_rest_step(
+                rest_seconds=rest_seconds,
+                step_order=2,
+                description=f"{int(rest_seconds)}s rest"
+            ),
+        ]
+
+        repeat_group = self._create_repeat_group(
+            iterations=reps,
+            child_steps=child_steps,
+            step_order=step_order,
+            description=f"{reps}×{int(distance)} @ {intensity}"
+        )
+        return [repeat_group], step_order + 1
+
+    # Indexed by _classify_exercise()
+    _EXERCISE_BUILDERS = (
+        _build_distance_exercise,
+        _build_sets_exercise,
+        _build_description_exercise,
+    )
+
     def _exercise_to_garmin_steps(
         self,
         exercise: Dict[str, Any],
@@ -442,111 +764,8 @@ class GarminWorkoutManager:
         Returns:
             Tuple of (list of steps, next step order)
         """
-        steps = []
-        current_order = step_order
-
-        # Check for simple distance-based exercise
-        if exercise.get("distance") and not exercise.get("sets"):
-            distance = self.parse_distance_string(exercise["distance"])
-            if distance:
-                step = self._create_swim_interval_step(
-                    distance=distance,
-                    step_order=current_order,
-                    step_type=step_type,
-                    description=exercise.get("name", "")
-                )
-                steps.append(step)
-                current_order += 1
-            return steps, current_order
-
-        # Check for sets-based exercise (e.g., "4×50")
-        if exercise.get("sets"):
-            reps, value, unit = self.parse_sets_string(exercise["sets"])
-            rest_seconds = self.parse_rest_string(exercise.get("rest", ""))
-
-            if reps and value and unit == "distance":
-                # Create repeat group with interval + optional rest
-                child_steps = []
-
-                # Interval step
-                interval_step = self._create_swim_interval_step(
-                    distance=value,
-                    step_order=1,
-                    step_type="interval",
-                    description=exercise.get("notes", exercise.get("name", ""))
-                )
-                child_steps.append(interval_step)
-
-                # Rest step (if specified)
-                if rest_seconds:
-                    rest_step = self._create_rest_step(
-                        rest_seconds=rest_seconds,
-                        step_order=2,
-                        description=f"{int(rest_seconds)}s rest"
-                    )
-                    child_steps.append(rest_step)
-
-                # Create repeat group
-                group_desc = f"{reps}×{int(value)}"
-                if rest_seconds:
-                    group_desc += f", {int(rest_seconds)}s rest"
-                if exercise.get("notes"):
-                    group_desc += f" - {exercise['notes']}"
-
-                repeat_group = self._create_repeat_group(
-                    iterations=reps,
-                    child_steps=child_steps,
-                    step_order=current_order,
-                    description=group_desc
-                )
-                steps.append(repeat_group)
-                current_order += 1
-
-            return steps, current_order
-
-        # Fallback: parse description for main set pattern like "12×50 @ moderate-hard, 20s rest"
-        description = exercise.get("description", "")
-        if description:
-            # Try to parse "12×50 @ intensity, 20s rest" pattern
-            match = re.match(r'(\d+)[×x](\d+)\s*@\s*([^,]+),?\s*(\d+s?\s*rest)?', description, re.IGNORECASE)
-            if match:
-                reps = int(match.group(1))
-                distance = float(match.group(2))
-                intensity = match.group(3).strip()
-                rest_match = match.group(4)
-                rest_seconds = self.parse_rest_string(rest_match) if rest_match else 20.0
-
-                child_steps = []
-
-                # Interval step
-                interval_step = self._create_swim_interval_step(
-                    distance=distance,
-                    step_order=1,
-                    step_type="interval",
-                    description=intensity
-                )
-                child_steps.append(interval_step)
-
-                # Rest step
-                rest_step = self._create_rest_step(
-                    rest_seconds=rest_seconds,
-                    step_order=2,
-                    description=f"{int(rest_seconds)}s rest"
-                )
-                child_steps.append(rest_step)
-
-                repeat_group = self._create_repeat_group(
-                    iterations=reps,
-                    child_steps=child_steps,
-                    step_order=current_order,
-                    description=f"{reps}×{int(distance)} @ {intensity}"
-                )
-                steps.append(repeat_group)
-                current_order += 1
-
-                return steps, current_order
-
-        return steps, current_order
+        builder = self._EXERCISE_BUILDERS[self._classify_exercise(exercise)]
+        return builder(self, exercise, step_order, step_type)
 
     def create_detailed_swim_workout(
         self,
@@ -573,7 +792,7 @@ class GarminWorkoutManager:
         Returns:
             Garmin workout JSON ready for API upload
         """
-        sport_info = self.SPORT_TYPE_MAP[WorkoutSportType.SWIMMING]
+        sport_info = WorkoutSportType.SWIMMING.sport_info
         garmin_steps = []
         step_order = 1
 
@@ -598,35 +817,14 @@ class GarminWorkoutManager:
             new_steps, step_order = self._exercise_to_garmin_steps(exercise, step_order, step_type)
             garmin_steps.extend(new_steps)
 
-        # Build workout JSON
-        workout_json = {
-            "workoutName": name,
-            "description": f"Week {week_number} - Detailed swim workout",
-            "sportType": sport_info,
-            "subSportType": None,
-            "poolLength": float(pool_length),
-            "poolLengthUnit": self.POOL_LENGTH_UNIT,
-            "workoutSegments": [
-                {
-                    "segmentOrder": 1,
-                    "sportType": sport_info,
-                    "poolLengthUnit": self.POOL_LENGTH_UNIT,
-                    "poolLength": float(pool_length),
-                    "avgTrainingSpeed": None,
-                    "estimatedDurationInSecs": None,
-                    "estimatedDistanceInMeters": None,
-                    "estimatedDistanceUnit": None,
-                    "estimateType": None,
-                    "description": None,
-                    "workoutSteps": garmin_steps
-                }
-            ],
-            "estimatedDurationInSecs": 2700,  # 45 min estimate
-            "estimatedDistanceInMeters": None,
-            "avgTrainingSpeed": 0.0
-        }
-
-        return workout_json
+        return self._build_workout_envelope(
+            name=name,
+            description=f"Week {week_number} - Detailed swim workout",
+            sport_info=sport_info,
+            garmin_steps=garmin_steps,
+            estimated_secs=2700,  # 45 min estimate
+            pool_length=float(pool_length)
+        )
 
     def upload_detailed_workout(self, workout_json: Dict[str, Any]) -> Optional[str]:
         """
@@ -644,20 +842,46 @@ class GarminWorkoutManager:
             result = garth.connectapi(
                 "/workout-service/workout",
                 method="POST",
-                json=workout_json
+                **_json_body(workout_json)
             )
 
+            self._invalidate("workouts")
             workout_id = str(result.get("workoutId"))
-            print(f"✓ Uploaded detailed workout '{workout_json.get('workoutName')}' - ID: {workout_id}")
+            logger.info("Uploaded detailed workout '%s' - ID: %s", workout_json.get('workoutName'), workout_id)
             return workout_id
 
-        except Exception as e:
-            print(f"✗ Error uploading detailed workout: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error uploading detailed workout '%s'", workout_json.get('workoutName'))
             return None
 
+    def upload_detailed_workouts(
+        self,
+        workouts: List[Dict[str, Any]],
+        max_workers: int = 4
+    ) -> List[Optional[str]]:
+        """
+        Upload several detailed workouts concurrently.
+
+        Args:
+            workouts: Workouts in Garmin API format
+            max_workers: Maximum number of concurrent Garmin requests
+
+        Returns:
+            Workout ID (or None on failure) for each workout, in input order
+        """
+        if not workouts:
+            return []
+
+        # Resume garth once up front rather than racing inside the workers
+        self._ensure_garth()
+        workers = min(max_workers, len(workouts))
+        _ensure_garth_pool(workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.upload_detailed_workout, workouts))
+
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_sets_and_reps(sets_str: str) -> Tuple[Optional[int], Optional[int]]:
         """
         Parse sets and reps from a string like "3×8-10" or "2×10".
@@ -674,7 +898,7 @@ class GarminWorkoutManager:
             return None, None
 
         # Match patterns like "3×8-10", "2x10", "4×12"
-        match = re.match(r'(\d+)[×x](\d+)(?:-(\d+))?', sets_str, re.IGNORECASE)
+        match = _SETS_AND_REPS_RE.match(sets_str.lower())
         if match:
             num_sets = int(match.group(1))
             reps_low = int(match.group(2))
@@ -708,14 +932,6 @@ class GarminWorkoutManager:
         Returns:
             ExecutableStepDTO dictionary
         """
-        step_type_map = {
-            "warmup": {"stepTypeId": 1, "stepTypeKey": "warmup", "displayOrder": 1},
-            "cooldown": {"stepTypeId": 2, "stepTypeKey": "cooldown", "displayOrder": 2},
-            "interval": {"stepTypeId": 3, "stepTypeKey": "interval", "displayOrder": 3},
-            "rest": {"stepTypeId": 5, "stepTypeKey": "rest", "displayOrder": 5},
-            "other": {"stepTypeId": 7, "stepTypeKey": "other", "displayOrder": 7},
-        }
-
         # Build description
         desc_parts = [exercise_name]
         if sets:
@@ -752,14 +968,14 @@ class GarminWorkoutManager:
         return {
             "type": "ExecutableStepDTO",
             "stepOrder": step_order,
-            "stepType": step_type_map.get(step_type, step_type_map["other"]),
+            "stepType": self._STRENGTH_STEP_TYPE_MAP.get(step_type, WorkoutStepType.OTHER.step_info),
             "childStepId": None,
             "description": description,
             "endCondition": end_condition,
             "endConditionValue": end_condition_value,
             "preferredEndConditionUnit": None,
             "endConditionCompare": None,
-            "targetType": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
+            "targetType": _NO_TARGET,
             "targetValueOne": None,
             "targetValueTwo": None,
             "targetValueUnit": None,
@@ -770,8 +986,8 @@ class GarminWorkoutManager:
             "secondaryTargetValueUnit": None,
             "secondaryZoneNumber": None,
             "endConditionZone": None,
-            "strokeType": {"strokeTypeId": 0, "strokeTypeKey": None, "displayOrder": 0},
-            "equipmentType": {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0},
+            "strokeType": _STROKE_NONE,
+            "equipmentType": _EQUIPMENT_NONE,
             "category": None,
             "exerciseName": exercise_name,
             "workoutProvider": None,
@@ -877,7 +1093,7 @@ class GarminWorkoutManager:
         Returns:
             Garmin workout JSON ready for API upload
         """
-        sport_info = self.SPORT_TYPE_MAP[WorkoutSportType.STRENGTH]
+        sport_info = WorkoutSportType.STRENGTH.sport_info
         garmin_steps = []
         step_order = 1
 
@@ -906,33 +1122,13 @@ class GarminWorkoutManager:
             new_steps, step_order = self._strength_exercise_to_garmin_steps(exercise, step_order, "cooldown")
             garmin_steps.extend(new_steps)
 
-        # Build workout JSON
-        workout_json = {
-            "workoutName": name,
-            "description": f"Week {week_number} - Detailed strength workout",
-            "sportType": sport_info,
-            "subSportType": None,
-            "workoutSegments": [
-                {
-                    "segmentOrder": 1,
-                    "sportType": sport_info,
-                    "poolLengthUnit": None,
-                    "poolLength": None,
-                    "avgTrainingSpeed": None,
-                    "estimatedDurationInSecs": None,
-                    "estimatedDistanceInMeters": None,
-                    "estimatedDistanceUnit": None,
-                    "estimateType": None,
-                    "description": None,
-                    "workoutSteps": garmin_steps
-                }
-            ],
-            "estimatedDurationInSecs": 2700,  # 45 min estimate
-            "estimatedDistanceInMeters": None,
-            "avgTrainingSpeed": 0.0
-        }
-
-        return workout_json
+        return self._build_workout_envelope(
+            name=name,
+            description=f"Week {week_number} - Detailed strength workout",
+            sport_info=sport_info,
+            garmin_steps=garmin_steps,
+            estimated_secs=2700  # 45 min estimate
+        )
 
     def _strides_to_garmin_steps(
         self,
@@ -963,26 +1159,23 @@ class GarminWorkoutManager:
             # Fallback: return empty list if can't parse
             return [], step_order
 
-        # Create child steps for the repeat group
-        child_steps = []
-
-        # Stride interval (time-based)
-        stride_step = self._create_cardio_interval_step(
-            duration_seconds=duration_secs,
-            step_order=1,
-            step_type="interval",
-            description=f"Stride ({int(duration_secs)}s)"
-        )
-        child_steps.append(stride_step)
-
-        # Recovery step (walk-back)
-        recovery_step = self._create_cardio_interval_step(
-            duration_seconds=recovery_seconds,
-            step_order=2,
-            step_type="recovery",
-            description="Walk-back recovery"
-        )
-        child_steps.append(recovery_step)
+        # Child steps for the repeat group
+        child_steps = [
+            # Stride interval (time-based)
+            self._create_cardio_interval_step(
+                duration_seconds=duration_secs,
+                step_order=1,
+                step_type="interval",
+                description=f"Stride ({int(duration_secs)}s)"
+            ),
+            # Recovery step (walk-back)
+            self._create_cardio_interval_step(
+                duration_seconds=recovery_seconds,
+                step_order=2,
+                step_type="recovery",
+                description="Walk-back recovery"
+            ),
+        ]
 
         # Create repeat group
         group_desc = f"{num_strides}×{int(duration_secs)}s {description}"
@@ -1006,51 +1199,151 @@ class GarminWorkoutManager:
         Create a cardio interval step (time-based).
 
         Args:
-            duration_seconds: Duration in seconds
+            duration_seconds: Duration in seconds, already a float (as the parsers return it)
             step_order: Step order number
-            step_type: Step type key (interval, warmup, cooldown, recovery)
+            step_type: Step type key (interval, warmup, cooldown, recovery, other)
             description: Optional description
 
         Returns:
             ExecutableStepDTO dictionary
         """
-        step_type_map = {
-            "interval": {"stepTypeId": 3, "stepTypeKey": "interval", "displayOrder": 3},
-            "warmup": {"stepTypeId": 1, "stepTypeKey": "warmup", "displayOrder": 1},
-            "cooldown": {"stepTypeId": 2, "stepTypeKey": "cooldown", "displayOrder": 2},
-            "recovery": {"stepTypeId": 4, "stepTypeKey": "recovery", "displayOrder": 4},
-        }
+        step = _EXEC_STEP_TEMPLATE.copy()
+        step["stepOrder"] = step_order
+        step["stepType"] = self._CARDIO_STEP_TYPE_MAP.get(step_type, WorkoutStepType.INTERVAL.step_info)
+        step["description"] = description
+        step["endCondition"] = self.CONDITION_TYPE_MAP["time"]
+        step["endConditionValue"] = duration_seconds
+        return step
 
-        return {
-            "type": "ExecutableStepDTO",
-            "stepOrder": step_order,
-            "stepType": step_type_map.get(step_type, step_type_map["interval"]),
-            "childStepId": None,
-            "description": description,
-            "endCondition": self.CONDITION_TYPE_MAP["time"],
-            "endConditionValue": float(duration_seconds),
-            "preferredEndConditionUnit": None,
-            "endConditionCompare": None,
-            "targetType": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
-            "targetValueOne": None,
-            "targetValueTwo": None,
-            "targetValueUnit": None,
-            "zoneNumber": None,
-            "secondaryTargetType": None,
-            "secondaryTargetValueOne": None,
-            "secondaryTargetValueTwo": None,
-            "secondaryTargetValueUnit": None,
-            "secondaryZoneNumber": None,
-            "endConditionZone": None,
-            "strokeType": {"strokeTypeId": 0, "strokeTypeKey": None, "displayOrder": 0},
-            "equipmentType": {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0},
-            "category": None,
-            "exerciseName": None,
-            "workoutProvider": None,
-            "providerExerciseSourceId": None,
-            "weightValue": None,
-            "weightUnit": None
-        }
+    def _vo2_warmup_steps(
+        self,
+        exercise: Dict[str, Any],
+        step_order: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Build the step(s) for a VO2 warmup exercise: strides, a timed step or a lap-button step."""
+        strides = exercise.get("strides")
+        if strides:
+            # Strides as RepeatGroupDTO with time-based intervals
+            # e.g., "4×20s" becomes 4 iterations of (20s interval + 45s recovery)
+            recovery = exercise.get("recovery")
+            recovery_secs = self.parse_rest_string(recovery) if recovery else 45.0
+            return self._strides_to_garmin_steps(
+                strides_str=strides,
+                step_order=step_order,
+                recovery_seconds=recovery_secs,
+                description=exercise.get("name", "Strides")
+            )
+
+        step_type = "warmup" if step_order == 1 else "other"
+        duration = exercise.get("duration")
+        if duration:
+            duration_secs = self.parse_duration_string(duration)
+            if not duration_secs:
+                return [], step_order
+            step = self._create_cardio_interval_step(
+                duration_seconds=duration_secs,
+                step_order=step_order,
+                step_type=step_type,
+                description=exercise.get("name", "Warmup")
+            )
+        else:
+            # Generic step with lap button - avoid this by providing duration or strides
+            step = self._create_strength_step(
+                exercise_name=exercise.get("name", "Warmup"),
+                step_order=step_order,
+                step_type=step_type
+            )
+        return [step], step_order + 1
+
+    def _vo2_main_steps(
+        self,
+        exercise: Dict[str, Any],
+        step_order: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Build a repeat group from a VO2 main set description, or a generic step if it doesn't parse."""
+        description = exercise.get("description", "")
+
+        # Try to parse "6×2 min @ hard (RPE 8), 2 min easy between" pattern
+        match = _VO2_INTERVAL_RE.match(description)
+        if not match:
+            # Fallback - just add as a generic step
+            step = self._create_strength_step(
+                exercise_name=exercise.get("name", "Main Set"),
+                step_order=step_order,
+                step_type="interval",
+                notes=description
+            )
+            return [step], step_order + 1
+
+        reps = int(match.group(1))
+        interval_value = float(match.group(2))
+        interval_unit = match.group(3) or 'min'
+        intensity = match.group(4).strip()
+        rest_value = float(match.group(5))
+        rest_unit = match.group(6) or 'min'
+
+        # Convert to seconds
+        if interval_unit.lower() in ('min', 'm'):
+            interval_secs = interval_value * 60
+        else:
+            interval_secs = interval_value
+
+        if rest_unit.lower() in ('min', 'm'):
+            rest_secs = rest_value * 60
+        else:
+            rest_secs = rest_value
+
+        # Create repeat group
+        child_steps = [
+            # Hard interval
+            self._create_cardio_interval_step(
+                duration_seconds=interval_secs,
+                step_order=1,
+                step_type="interval",
+                description=f"Hard @ {intensity}"
+            ),
+            # Recovery
+            self._create_cardio_interval_step(
+                duration_seconds=rest_secs,
+                step_order=2,
+                step_type="recovery",
+                description="Easy recovery"
+            ),
+        ]
+
+        repeat_group = self._create_repeat_group(
+            iterations=reps,
+            child_steps=child_steps,
+            step_order=step_order,
+            description=f"{reps}×{int(interval_value)} min @ {intensity}"
+        )
+        return [repeat_group], step_order + 1
+
+    def _vo2_cooldown_steps(
+        self,
+        exercise: Dict[str, Any],
+        step_order: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Build a timed cooldown step; exercises without a parseable duration are skipped."""
+        duration = exercise.get("duration")
+        duration_secs = self.parse_duration_string(duration) if duration else None
+        if not duration_secs:
+            return [], step_order
+
+        step = self._create_cardio_interval_step(
+            duration_seconds=duration_secs,
+            step_order=step_order,
+            step_type="cooldown",
+            description=exercise.get("name", "Cooldown")
+        )
+        return [step], step_order + 1
+
+    # workout_details key -> step builder, in the order the phases are emitted
+    _VO2_PHASES = (
+        ("warmup", _vo2_warmup_steps),
+        ("main", _vo2_main_steps),
+        ("cooldown", _vo2_cooldown_steps),
+    )
 
     def create_detailed_vo2_workout(
         self,
@@ -1070,163 +1363,71 @@ class GarminWorkoutManager:
         Returns:
             Garmin workout JSON ready for API upload
         """
-        sport_info = self.SPORT_TYPE_MAP[WorkoutSportType.CARDIO]  # Uses running
+        sport_info = WorkoutSportType.CARDIO.sport_info  # Uses running
         garmin_steps = []
         step_order = 1
 
-        # Process warmup
-        warmup_exercises = workout_details.get("warmup", [])
-        for exercise in warmup_exercises:
-            duration = exercise.get("duration")
-            strides = exercise.get("strides")
-
-            if strides:
-                # Strides as RepeatGroupDTO with time-based intervals
-                # e.g., "4×20s" becomes 4 iterations of (20s interval + 45s recovery)
-                recovery = exercise.get("recovery")
-                recovery_secs = self.parse_rest_string(recovery) if recovery else 45.0
-                new_steps, step_order = self._strides_to_garmin_steps(
-                    strides_str=strides,
-                    step_order=step_order,
-                    recovery_seconds=recovery_secs,
-                    description=exercise.get("name", "Strides")
-                )
+        for phase, build in self._VO2_PHASES:
+            for exercise in workout_details.get(phase, ()):
+                new_steps, step_order = build(self, exercise, step_order)
                 garmin_steps.extend(new_steps)
-            elif duration:
-                duration_secs = self.parse_duration_string(duration)
-                if duration_secs:
-                    step = self._create_cardio_interval_step(
-                        duration_seconds=duration_secs,
-                        step_order=step_order,
-                        step_type="warmup" if step_order == 1 else "other",
-                        description=exercise.get("name", "Warmup")
-                    )
-                    garmin_steps.append(step)
-                    step_order += 1
-            else:
-                # Generic step with lap button - avoid this by providing duration or strides
-                step = self._create_strength_step(
-                    exercise_name=exercise.get("name", "Warmup"),
-                    step_order=step_order,
-                    step_type="warmup" if step_order == 1 else "other"
-                )
-                garmin_steps.append(step)
-                step_order += 1
-
-        # Process main set - parse interval description
-        main_exercises = workout_details.get("main", [])
-        for exercise in main_exercises:
-            description = exercise.get("description", "")
-
-            # Try to parse "6×2 min @ hard (RPE 8), 2 min easy between" pattern
-            match = re.match(
-                r'(\d+)[×x](\d+(?:\.\d+)?)\s*(min|s|sec)?\s*@\s*([^,]+),?\s*(\d+(?:\.\d+)?)\s*(min|s|sec)?\s*(?:easy\s+)?(?:between|rest)?',
-                description,
-                re.IGNORECASE
-            )
-            if match:
-                reps = int(match.group(1))
-                interval_value = float(match.group(2))
-                interval_unit = match.group(3) or 'min'
-                intensity = match.group(4).strip()
-                rest_value = float(match.group(5))
-                rest_unit = match.group(6) or 'min'
-
-                # Convert to seconds
-                if interval_unit.lower() in ('min', 'm'):
-                    interval_secs = interval_value * 60
-                else:
-                    interval_secs = interval_value
-
-                if rest_unit.lower() in ('min', 'm'):
-                    rest_secs = rest_value * 60
-                else:
-                    rest_secs = rest_value
-
-                # Create repeat group
-                child_steps = []
-
-                # Hard interval
-                interval_step = self._create_cardio_interval_step(
-                    duration_seconds=interval_secs,
-                    step_order=1,
-                    step_type="interval",
-                    description=f"Hard @ {intensity}"
-                )
-                child_steps.append(interval_step)
-
-                # Recovery
-                recovery_step = self._create_cardio_interval_step(
-                    duration_seconds=rest_secs,
-                    step_order=2,
-                    step_type="recovery",
-                    description="Easy recovery"
-                )
-                child_steps.append(recovery_step)
-
-                # Create repeat group
-                repeat_group = self._create_repeat_group(
-                    iterations=reps,
-                    child_steps=child_steps,
-                    step_order=step_order,
-                    description=f"{reps}×{int(interval_value)} min @ {intensity}"
-                )
-                garmin_steps.append(repeat_group)
-                step_order += 1
-            else:
-                # Fallback - just add as a generic step
-                step = self._create_strength_step(
-                    exercise_name=exercise.get("name", "Main Set"),
-                    step_order=step_order,
-                    step_type="interval",
-                    notes=description
-                )
-                garmin_steps.append(step)
-                step_order += 1
 
-        # Process cooldown
-        cooldown_exercises = workout_details.get("cooldown", [])
-        for exercise in cooldown_exercises:
-            duration = exercise.get("duration")
-            if duration:
-                duration_secs = self.parse_duration_string(duration)
-                if duration_secs:
-                    step = self._create_cardio_interval_step(
-                        duration_seconds=duration_secs,
-                        step_order=step_order,
-                        step_type="cooldown",
-                        description=exercise.get("name", "Cooldown")
-                    )
-                    garmin_steps.append(step)
-                    step_order += 1
-
-        # Build workout JSON
-        workout_json = {
-            "workoutName": name,
-            "description": f"Week {week_number} - VO2 max intervals",
-            "sportType": sport_info,
-            "subSportType": None,
-            "workoutSegments": [
-                {
-                    "segmentOrder": 1,
-                    "sportType": sport_info,
-                    "poolLengthUnit": None,
-                    "poolLength": None,
-                    "avgTrainingSpeed": None,
-                    "estimatedDurationInSecs": None,
-                    "estimatedDistanceInMeters": None,
-                    "estimatedDistanceUnit": None,
-                    "estimateType": None,
-                    "description": None,
-                    "workoutSteps": garmin_steps
-                }
-            ],
-            "estimatedDurationInSecs": 2400,  # 40 min estimate
-            "estimatedDistanceInMeters": None,
-            "avgTrainingSpeed": 0.0
-        }
+        return self._build_workout_envelope(
+            name=name,
+            description=f"Week {week_number} - VO2 max intervals",
+            sport_info=sport_info,
+            garmin_steps=garmin_steps,
+            estimated_secs=2400  # 40 min estimate
+        )
 
-        return workout_json
+    # Prototype steps for the simple workout builders. Fixed steps are shared
+    # as-is (WorkoutStep is frozen); the others are specialized per workout
+    # with dataclasses.replace().
+    _SWIM_WARMUP_PROTO = WorkoutStep(type=WorkoutStepType.WARMUP, duration_type="distance", target_type="open")
+    _SWIM_COOLDOWN_PROTO = WorkoutStep(type=WorkoutStepType.COOLDOWN, duration_type="distance", target_type="open")
+    _SWIM_TIME_TRIAL = WorkoutStep(
+        type=WorkoutStepType.INTERVAL,
+        duration_type="distance",
+        duration_value=400.0,
+        target_type="open",
+        description="400y Time Trial - Push start. Controlled first 100, build through 200-300, hold form."
+    )
+    _LAP_INTERVAL_PROTO = WorkoutStep(type=WorkoutStepType.INTERVAL, duration_type="lap.button", target_type="open")
+    _STRENGTH_WARMUP = WorkoutStep(
+        type=WorkoutStepType.WARMUP,
+        duration_type="time",
+        duration_value=300.0,  # 5 minutes
+        target_type="open",
+        description="Dynamic warmup - foam roll, stretches, activation"
+    )
+    _STRENGTH_COOLDOWN = WorkoutStep(
+        type=WorkoutStepType.COOLDOWN,
+        duration_type="time",
+        duration_value=300.0,  # 5 minutes
+        target_type="open",
+        description="Cooldown - stretching and mobility"
+    )
+    _VO2_WARMUP = WorkoutStep(
+        type=WorkoutStepType.WARMUP,
+        duration_type="time",
+        duration_value=480.0,  # 8 minutes
+        target_type="open",
+        description="Easy warmup + dynamic stretches"
+    )
+    _VO2_COOLDOWN = WorkoutStep(
+        type=WorkoutStepType.COOLDOWN,
+        duration_type="time",
+        duration_value=300.0,  # 5 minutes
+        target_type="open",
+        description="Easy cooldown + stretching"
+    )
+    _TIMED_INTERVAL_PROTO = WorkoutStep(type=WorkoutStepType.INTERVAL, duration_type="time", target_type="open")
+    _TIMED_RECOVERY_PROTO = WorkoutStep(
+        type=WorkoutStepType.RECOVERY,
+        duration_type="time",
+        target_type="open",
+        description="Easy recovery"
+    )
 
     def __init__(self, client: Optional[GarminClient] = None):
         """
@@ -1237,7 +1438,43 @@ class GarminWorkoutManager:
         """
         self.client = client or GarminClient()
         self._authenticated = False
-        self._garth_initialized = False
+        # Rendered Garmin formats keyed by GarminWorkout._as_key()
+        self._format_cache: Dict[Tuple, Dict[str, Any]] = {}
+        # Batch uploads render from worker threads
+        self._format_cache_lock = threading.Lock()
+        # GET responses keyed by endpoint: key -> (fetched_at, response)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Bumped by _invalidate so a fetch that overlapped it isn't stored
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+
+    def _cached(self, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """
+        Return a cached response younger than ttl, otherwise fetch and store it.
+
+        Callers always get their own copy, so editing a result can't change
+        what later readers see. A response whose fetch overlapped an
+        _invalidate is returned but not stored, since it may predate the
+        change that triggered the invalidation.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            generation = self._cache_generation
+        if entry is not None and now - entry[0] < ttl:
+            return copy.deepcopy(entry[1])
+        value = fetch()
+        with self._cache_lock:
+            if self._cache_generation == generation:
+                self._cache[key] = (now, copy.deepcopy(value))
+        return value
+
+    def _invalidate(self, *prefixes: str):
+        """Drop cached responses whose key starts with any of the prefixes."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            for key in [key for key in self._cache if key.startswith(prefixes)]:
+                del self._cache[key]
 
     def _ensure_authenticated(self):
         """Ensure we're authenticated with Garmin Connect."""
@@ -1247,16 +1484,22 @@ class GarminWorkoutManager:
 
     def _ensure_garth(self):
         """Ensure garth is available and authenticated."""
+        global _GARTH_READY
+        # Fast path: once tokens are resumed, every call is a single global read
+        if _GARTH_READY:
+            return
+
         if not GARTH_AVAILABLE:
             raise RuntimeError("garth library not available - install with: pip install garth")
 
-        if not self._garth_initialized:
-            # Try to resume from saved tokens
-            try:
-                garth.resume("~/.garth")
-                self._garth_initialized = True
-            except Exception:
-                raise RuntimeError("garth not authenticated - run garth.login() first")
+        with _GARTH_LOCK:
+            if not _GARTH_READY:
+                # Try to resume from saved tokens
+                try:
+                    garth.resume("~/.garth")
+                except Exception:
+                    raise RuntimeError("garth not authenticated - run garth.login() first")
+                _GARTH_READY = True
 
     def create_swim_workout(
         self,
@@ -1280,43 +1523,26 @@ class GarminWorkoutManager:
             pool_length: Pool length (default 25 yards)
             is_test_day: Whether this is a 400 TT test day
         """
-        steps = []
-
-        # Warmup
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.WARMUP,
-            duration_type="distance",
-            duration_value=warmup_distance,
-            target_type="open",
-            description=f"Easy warmup - {warmup_distance}y"
-        ))
-
         if is_test_day:
             # Test day: 400 TT
-            steps.append(WorkoutStep(
-                type=WorkoutStepType.INTERVAL,
-                duration_type="distance",
-                duration_value=400,
-                target_type="open",
-                description="400y Time Trial - Push start. Controlled first 100, build through 200-300, hold form."
-            ))
+            main_step = self._SWIM_TIME_TRIAL
         else:
             # Regular main set - use lap button for open-ended
-            steps.append(WorkoutStep(
-                type=WorkoutStepType.INTERVAL,
-                duration_type="lap.button",
-                target_type="open",
-                description=f"Main Set: {main_set_description}"
-            ))
+            main_step = replace(self._LAP_INTERVAL_PROTO, description=f"Main Set: {main_set_description}")
 
-        # Cooldown
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.COOLDOWN,
-            duration_type="distance",
-            duration_value=cooldown_distance,
-            target_type="open",
-            description=f"Easy cooldown - {cooldown_distance}y"
-        ))
+        steps = [
+            replace(
+                self._SWIM_WARMUP_PROTO,
+                duration_value=warmup_distance,
+                description=f"Easy warmup - {warmup_distance}y"
+            ),
+            main_step,
+            replace(
+                self._SWIM_COOLDOWN_PROTO,
+                duration_value=cooldown_distance,
+                description=f"Easy cooldown - {cooldown_distance}y"
+            ),
+        ]
 
         return GarminWorkout(
             name=name,
@@ -1342,40 +1568,16 @@ class GarminWorkoutManager:
             workout_type: "lower" or "upper" body
             exercises: List of exercise dictionaries
         """
-        steps = []
-
-        # Warmup
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.WARMUP,
-            duration_type="time",
-            duration_value=300,  # 5 minutes
-            target_type="open",
-            description="Dynamic warmup - foam roll, stretches, activation"
-        ))
-
-        # Exercise steps
-        for exercise in exercises:
-            sets = exercise.get('sets', 3)
-            reps = exercise.get('reps', '8-10')
-            desc = f"{exercise['name']}: {sets}x{reps}"
-            if exercise.get('notes'):
-                desc += f" - {exercise['notes']}"
-
-            steps.append(WorkoutStep(
-                type=WorkoutStepType.INTERVAL,
-                duration_type="lap.button",
-                target_type="open",
-                description=desc
-            ))
-
-        # Cooldown/finisher
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.COOLDOWN,
-            duration_type="time",
-            duration_value=300,  # 5 minutes
-            target_type="open",
-            description="Cooldown - stretching and mobility"
-        ))
+        steps = [
+            self._STRENGTH_WARMUP,
+            # Exercise steps
+            *[
+                replace(self._LAP_INTERVAL_PROTO, description=self._strength_step_description(exercise))
+                for exercise in exercises
+            ],
+            # Cooldown/finisher
+            self._STRENGTH_COOLDOWN,
+        ]
 
         body_part = "Lower Body" if workout_type == "lower" else "Upper Body"
 
@@ -1387,6 +1589,16 @@ class GarminWorkoutManager:
             estimated_duration_minutes=45
         )
 
+    @staticmethod
+    def _strength_step_description(exercise: Dict[str, Any]) -> str:
+        """Describe an exercise as "Name: SETSxREPS - notes" for a lap-button step."""
+        sets = exercise.get('sets', 3)
+        reps = exercise.get('reps', '8-10')
+        desc = f"{exercise['name']}: {sets}x{reps}"
+        if exercise.get('notes'):
+            desc += f" - {exercise['notes']}"
+        return desc
+
     def create_vo2_workout(
         self,
         name: str,
@@ -1407,51 +1619,27 @@ class GarminWorkoutManager:
             rest_duration_minutes: Rest between intervals
             intensity: Intensity description (e.g., "RPE 8-9")
         """
-        steps = []
-
-        # Warmup
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.WARMUP,
-            duration_type="time",
-            duration_value=480,  # 8 minutes
-            target_type="open",
-            description="Easy warmup + dynamic stretches"
-        ))
-
         # Intervals as a repeat block
         interval_steps = [
-            WorkoutStep(
-                type=WorkoutStepType.INTERVAL,
-                duration_type="time",
+            replace(
+                self._TIMED_INTERVAL_PROTO,
                 duration_value=interval_duration_minutes * 60,
-                target_type="open",
                 description=f"Hard effort @ {intensity}"
             ),
-            WorkoutStep(
-                type=WorkoutStepType.RECOVERY,
-                duration_type="time",
-                duration_value=rest_duration_minutes * 60,
-                target_type="open",
-                description="Easy recovery"
-            )
+            replace(self._TIMED_RECOVERY_PROTO, duration_value=rest_duration_minutes * 60),
         ]
 
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.REPEAT,
-            duration_type="lap.button",
-            repeat_count=intervals,
-            child_steps=interval_steps,
-            description=f"{intervals}x{interval_duration_minutes}min @ {intensity}, {rest_duration_minutes}min rest"
-        ))
-
-        # Cooldown
-        steps.append(WorkoutStep(
-            type=WorkoutStepType.COOLDOWN,
-            duration_type="time",
-            duration_value=300,  # 5 minutes
-            target_type="open",
-            description="Easy cooldown + stretching"
-        ))
+        steps = [
+            self._VO2_WARMUP,
+            WorkoutStep(
+                type=WorkoutStepType.REPEAT,
+                duration_type="lap.button",
+                repeat_count=intervals,
+                child_steps=interval_steps,
+                description=f"{intervals}x{interval_duration_minutes}min @ {intensity}, {rest_duration_minutes}min rest"
+            ),
+            self._VO2_COOLDOWN,
+        ]
 
         return GarminWorkout(
             name=name,
@@ -1465,76 +1653,49 @@ class GarminWorkoutManager:
         self,
         step: WorkoutStep,
         order: int,
-        is_swim: bool = False
+        is_swim: bool = False,
+        _conditions: Dict = CONDITION_TYPE_MAP,
+        _lap_button: Dict = CONDITION_TYPE_MAP["lap.button"],
+        _pool_unit: Dict = POOL_LENGTH_UNIT
     ) -> Dict[str, Any]:
         """
         Convert a WorkoutStep to Garmin's step format.
 
+        The underscore parameters bind the class constants at definition time so
+        the per-step lookups are plain local reads; don't pass them.
+
         Args:
             step: WorkoutStep to convert
             order: Step order number
             is_swim: Whether this is a swimming workout (affects stroke type)
         """
-        step_type_info = self.STEP_TYPE_MAP.get(step.type, self.STEP_TYPE_MAP[WorkoutStepType.OTHER])
+        step_type_info = step.type.step_info
 
         # Normalize duration_type
         duration_type = step.duration_type
         if duration_type == "lap_button":
             duration_type = "lap.button"
 
-        condition_info = self.CONDITION_TYPE_MAP.get(
-            duration_type,
-            self.CONDITION_TYPE_MAP["lap.button"]
-        )
+        condition_info = _conditions.get(duration_type, _lap_button)
 
-        # Build the step
-        garmin_step = {
-            "type": "ExecutableStepDTO",
-            "stepOrder": order,
-            "stepType": step_type_info,
-            "childStepId": None,
-            "description": step.description or "",
-            "endCondition": condition_info,
-            "endConditionValue": float(step.duration_value) if step.duration_value else None,
-            "preferredEndConditionUnit": None,
-            "endConditionCompare": None,
-            "targetType": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
-            "targetValueOne": None,
-            "targetValueTwo": None,
-            "targetValueUnit": None,
-            "zoneNumber": None,
-            "secondaryTargetType": None,
-            "secondaryTargetValueOne": None,
-            "secondaryTargetValueTwo": None,
-            "secondaryTargetValueUnit": None,
-            "secondaryZoneNumber": None,
-            "endConditionZone": None,
-            "strokeType": {"strokeTypeId": 6 if is_swim else 0, "strokeTypeKey": "free" if is_swim else None, "displayOrder": 6 if is_swim else 0},
-            "equipmentType": {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0},
-            "category": None,
-            "exerciseName": None,
-            "workoutProvider": None,
-            "providerExerciseSourceId": None,
-            "weightValue": None,
-            "weightUnit": None
-        }
+        # Start from the shared template; only per-step fields are assigned
+        garmin_step = (_SWIM_STEP_TEMPLATE if is_swim else _EXEC_STEP_TEMPLATE).copy()
+        garmin_step["stepOrder"] = order
+        garmin_step["stepType"] = step_type_info
+        garmin_step["description"] = step.description
+        garmin_step["endCondition"] = condition_info
+        garmin_step["endConditionValue"] = step.duration_value or None
 
         # Add preferred unit for swim distance steps
         if is_swim and duration_type == "distance":
-            garmin_step["preferredEndConditionUnit"] = self.POOL_LENGTH_UNIT
+            garmin_step["preferredEndConditionUnit"] = _pool_unit
 
         # Handle target types (heart rate, pace, etc.)
-        if step.target_type and step.target_type not in ("open", None):
-            target_map = {
-                "heart_rate": {"workoutTargetTypeId": 4, "workoutTargetTypeKey": "heart.rate.zone"},
-                "pace": {"workoutTargetTypeId": 2, "workoutTargetTypeKey": "pace.zone"},
-                "power": {"workoutTargetTypeId": 3, "workoutTargetTypeKey": "power.zone"},
-                "cadence": {"workoutTargetTypeId": 5, "workoutTargetTypeKey": "cadence"},
-            }
-            if step.target_type in target_map:
-                garmin_step["targetType"] = target_map[step.target_type]
-                garmin_step["targetValueOne"] = step.target_value_low
-                garmin_step["targetValueTwo"] = step.target_value_high
+        target_info = _TARGET_TYPE_MAP.get(step.target_type)
+        if target_info is not None:
+            garmin_step["targetType"] = target_info
+            garmin_step["targetValueOne"] = step.target_value_low
+            garmin_step["targetValueTwo"] = step.target_value_high
 
         return garmin_step
 
@@ -1543,53 +1704,85 @@ class GarminWorkoutManager:
         Convert a GarminWorkout to the format expected by Garmin Connect API.
 
         This creates the JSON structure needed for the workout creation API.
+        Renders are memoized by workout content, so re-uploading the same
+        template week after week only pays for a copy of the cached dict.
+        """
+        key = workout._as_key()
+        with self._format_cache_lock:
+            workout_json = self._format_cache.get(key)
+        if workout_json is None:
+            workout_json = self._render_workout(workout)
+            with self._format_cache_lock:
+                if key not in self._format_cache and len(self._format_cache) >= self.FORMAT_CACHE_SIZE:
+                    # Evict the oldest render
+                    del self._format_cache[next(iter(self._format_cache))]
+                self._format_cache[key] = workout_json
+        return _copy_workout_json(workout_json)
+
+    def _build_workout_envelope(
+        self,
+        name: str,
+        description: Optional[str],
+        sport_info: Dict[str, Any],
+        garmin_steps: List[Dict[str, Any]],
+        estimated_secs: int,
+        pool_length: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
-        sport_info = self.SPORT_TYPE_MAP.get(
-            workout.sport_type,
-            self.SPORT_TYPE_MAP[WorkoutSportType.OTHER]
-        )
-        is_swim = workout.sport_type == WorkoutSportType.SWIMMING
-
-        # Build workout steps in Garmin format
-        garmin_steps = []
-        step_order = 1
+        Wrap rendered steps in the workout JSON Garmin expects.
 
-        for step in workout.steps:
-            garmin_step = self._step_to_garmin_format(step, step_order, is_swim=is_swim)
-            garmin_steps.append(garmin_step)
-            step_order += 1
-
-            # Handle child steps (for repeat blocks)
-            if step.child_steps:
-                for child in step.child_steps:
-                    garmin_steps.append(self._step_to_garmin_format(child, step_order, is_swim=is_swim))
-                    step_order += 1
+        Args:
+            name: Workout name
+            description: Workout description
+            sport_info: sportType payload for the workout and its segment
+            garmin_steps: Steps already in Garmin format
+            estimated_secs: Estimated duration in seconds
+            pool_length: Pool length for detailed swim workouts; sets the pool
+                fields on both the workout and its segment
 
+        Returns:
+            Workout in Garmin API format
+        """
         workout_json = {
-            "workoutName": workout.name,
-            "description": workout.description if workout.description else None,
+            "workoutName": name,
+            "description": description,
             "sportType": sport_info,
             "subSportType": None,
-            "workoutSegments": [
-                {
-                    "segmentOrder": 1,
-                    "sportType": sport_info,
-                    "poolLengthUnit": None,
-                    "poolLength": None,
-                    "avgTrainingSpeed": None,
-                    "estimatedDurationInSecs": None,
-                    "estimatedDistanceInMeters": None,
-                    "estimatedDistanceUnit": None,
-                    "estimateType": None,
-                    "description": None,
-                    "workoutSteps": garmin_steps
-                }
-            ],
-            "estimatedDurationInSecs": (workout.estimated_duration_minutes or 45) * 60,
-            "estimatedDistanceInMeters": None,
-            "avgTrainingSpeed": 0.0
         }
 
+        segment = _SEGMENT_TEMPLATE.copy()
+        segment["sportType"] = sport_info
+        segment["workoutSteps"] = garmin_steps
+
+        if pool_length is not None:
+            workout_json["poolLength"] = pool_length
+            workout_json["poolLengthUnit"] = self.POOL_LENGTH_UNIT
+            segment["poolLengthUnit"] = self.POOL_LENGTH_UNIT
+            segment["poolLength"] = pool_length
+
+        workout_json["workoutSegments"] = [segment]
+        workout_json["estimatedDurationInSecs"] = estimated_secs
+        workout_json["estimatedDistanceInMeters"] = None
+        workout_json["avgTrainingSpeed"] = 0.0
+        return workout_json
+
+    def _render_workout(self, workout: GarminWorkout) -> Dict[str, Any]:
+        """Build the Garmin Connect JSON for a workout (uncached)."""
+        sport_info = workout.sport_type.sport_info
+        is_swim = workout.sport_type == WorkoutSportType.SWIMMING
+        step_to_garmin = self._step_to_garmin_format
+
+        workout_json = self._build_workout_envelope(
+            name=workout.name,
+            description=workout.description if workout.description else None,
+            sport_info=sport_info,
+            garmin_steps=[
+                step_to_garmin(step, order, is_swim=is_swim)
+                for order, step in enumerate(_walk_steps(workout.steps), start=1)
+            ],
+            estimated_secs=(workout.estimated_duration_minutes or 45) * 60
+        )
+
         # Add pool settings for swimming workouts
         if is_swim:
             workout_json["poolLength"] = 25.0
@@ -1615,15 +1808,16 @@ class GarminWorkoutManager:
             result = garth.connectapi(
                 "/workout-service/workout",
                 method="POST",
-                json=garmin_format
+                **_json_body(garmin_format)
             )
 
+            self._invalidate("workouts")
             workout_id = str(result.get("workoutId"))
-            print(f"✓ Uploaded workout '{workout.name}' - ID: {workout_id}")
+            logger.info("Uploaded workout '%s' - ID: %s", workout.name, workout_id)
             return workout_id
 
         except Exception as e:
-            print(f"✗ Error uploading workout '{workout.name}': {e}")
+            logger.error("Error uploading workout '%s': %s", workout.name, e)
             return None
 
     def schedule_workout(
@@ -1644,19 +1838,20 @@ class GarminWorkoutManager:
         self._ensure_garth()
 
         try:
-            date_str = scheduled_date.strftime("%Y-%m-%d")
+            date_str = scheduled_date.isoformat()
 
             garth.connectapi(
                 f"/workout-service/schedule/{workout_id}",
                 method="POST",
-                json={"date": date_str}
+                **_json_body({"date": date_str})
             )
+            self._invalidate("calendar:")
 
-            print(f"✓ Scheduled workout {workout_id} for {date_str}")
+            logger.info("Scheduled workout %s for %s", workout_id, date_str)
             return True
 
         except Exception as e:
-            print(f"✗ Error scheduling workout: {e}")
+            logger.error("Error scheduling workout %s: %s", workout_id, e)
             return False
 
     def create_and_schedule_workout(
@@ -1680,6 +1875,39 @@ class GarminWorkoutManager:
             return workout_id, scheduled
         return None, False
 
+    def upload_and_schedule_many(
+        self,
+        workouts_with_dates: List[Tuple[GarminWorkout, date]],
+        max_workers: int = 4
+    ) -> List[Tuple[Optional[str], bool]]:
+        """
+        Create and schedule several workouts concurrently.
+
+        Each workout's schedule call is chained directly after its own upload,
+        so round-trips for different workouts overlap instead of running
+        back to back.
+
+        Args:
+            workouts_with_dates: (workout, scheduled_date) pairs
+            max_workers: Maximum number of concurrent Garmin requests
+
+        Returns:
+            List of (workout_id, scheduled_success) in input order
+        """
+        if not workouts_with_dates:
+            return []
+
+        # Resume garth once up front rather than racing inside the workers
+        self._ensure_garth()
+        workers = min(max_workers, len(workouts_with_dates))
+        _ensure_garth_pool(workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda item: self.create_and_schedule_workout(*item),
+                workouts_with_dates
+            ))
+
     def get_workouts(self) -> List[Dict[str, Any]]:
         """
         Get all workouts from Garmin Connect.
@@ -1690,10 +1918,14 @@ class GarminWorkoutManager:
         self._ensure_garth()
 
         try:
-            workouts = garth.connectapi("/workout-service/workouts")
+            workouts = self._cached(
+                "workouts",
+                self.WORKOUTS_CACHE_TTL,
+                lambda: garth.connectapi("/workout-service/workouts")
+            )
             return workouts if workouts else []
         except Exception as e:
-            print(f"✗ Error getting workouts: {e}")
+            logger.error("Error getting workouts: %s", e)
             return []
 
     def get_workout(self, workout_id: str) -> Optional[Dict[str, Any]]:
@@ -1709,9 +1941,13 @@ class GarminWorkoutManager:
         self._ensure_garth()
 
         try:
-            return garth.connectapi(f"/workout-service/workout/{workout_id}")
+            return self._cached(
+                f"workout:{workout_id}",
+                self.WORKOUTS_CACHE_TTL,
+                lambda: garth.connectapi(f"/workout-service/workout/{workout_id}")
+            )
         except Exception as e:
-            print(f"✗ Error getting workout {workout_id}: {e}")
+            logger.error("Error getting workout %s: %s", workout_id, e)
             return None
 
     def verify_workout_format(self, workout_id: str, workout_type: str) -> Dict[str, Any]:
@@ -1845,11 +2081,12 @@ class GarminWorkoutManager:
                 f"/workout-service/workout/{workout_id}",
                 method="DELETE"
             )
-            print(f"✓ Deleted workout {workout_id}")
+            self._invalidate("workouts", f"workout:{workout_id}", "calendar:")
+            logger.info("Deleted workout %s", workout_id)
             return True
 
         except Exception as e:
-            print(f"✗ Error deleting workout: {e}")
+            logger.error("Error deleting workout %s: %s", workout_id, e)
             return False
 
     def get_calendar(self, year: int, month: int) -> List[Dict[str, Any]]:
@@ -1868,10 +2105,14 @@ class GarminWorkoutManager:
         try:
             # Garmin calendar API uses 0-indexed months
             api_month = month - 1
-            calendar = garth.connectapi(f"/calendar-service/year/{year}/month/{api_month}")
+            calendar = self._cached(
+                f"calendar:{year}:{month}",
+                self.CALENDAR_CACHE_TTL,
+                lambda: garth.connectapi(f"/calendar-service/year/{year}/month/{api_month}")
+            )
             return calendar.get("calendarItems", [])
         except Exception as e:
-            print(f"✗ Error getting calendar: {e}")
+            logger.error("Error getting calendar %s-%02d: %s", year, month, e)
             return []
 
     def get_scheduled_workouts(
@@ -1889,22 +2130,22 @@ class GarminWorkoutManager:
         Returns:
             List of scheduled workout dictionaries
         """
-        scheduled = []
-
-        # Get calendar items for each month in range
-        current = start_date.replace(day=1)
-        while current <= end_date:
-            items = self.get_calendar(current.year, current.month)
-            for item in items:
-                if item.get("itemType") == "workout":
-                    item_date = item.get("date")
-                    if item_date:
-                        scheduled.append(item)
-
-            # Move to next month
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # Enumerate every month in range up front, counting months from year 0
+        first_month = start_date.year * 12 + start_date.month - 1
+        last_month = end_date.year * 12 + end_date.month - 1
+        months = [(index // 12, index % 12 + 1) for index in range(first_month, last_month + 1)]
+
+        if not months:
+            return []
 
-        return scheduled
+        # Resume garth once, then fetch all months concurrently
+        self._ensure_garth()
+        with ThreadPoolExecutor(max_workers=min(6, len(months))) as executor:
+            calendars = list(executor.map(lambda ym: self.get_calendar(*ym), months))
+
+        return [
+            item
+            for items in calendars
+            for item in items
+            if item.get("itemType") == "workout" and item.get("date")
+        ]
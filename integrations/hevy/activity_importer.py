@@ -3,15 +3,61 @@ Hevy activity importer.
 Fetches strength training workouts from Hevy and stores them in the database.
 """
 
-import json
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import date, datetime, timedelta
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from integrations.hevy.client import HevyClient
+from integrations.serialization import to_json
 from database.models import CompletedActivity, Athlete
 
+# New workouts are committed in batches of this size instead of one by one
+_COMMIT_BATCH_SIZE = 100
+
+# Dialect INSERT constructs that support ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a Hevy ISO-8601 timestamp; fromisoformat reads the trailing 'Z' itself."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _build_set(set_info: dict) -> dict:
+    """Convert a Hevy set into the stored set format."""
+    # Keys are optional (weight_lbs only exists for weighted sets),
+    # so read through one bound .get rather than itemgetter
+    get = set_info.get
+    return {
+        'set_number': get('set_index', 0) + 1,
+        'reps': get('reps'),
+        'weight_lbs': get('weight_lbs'),
+        'weight_kg': get('weight_kg'),
+        'rpe': get('rpe'),
+        'distance_meters': get('distance_meters'),
+        'duration_seconds': get('duration_seconds'),
+    }
+
+
+def _build_exercise(exercise: dict) -> dict:
+    """Convert a Hevy exercise and its sets into the stored exercise format."""
+    return {
+        'exercise_name': exercise.get('title', 'Unknown Exercise'),
+        'exercise_type': exercise.get('exercise_type'),
+        'equipment_type': exercise.get('equipment_type'),
+        'muscle_group': exercise.get('muscle_group'),
+        'sets': [_build_set(set_info) for set_info in exercise.get('sets', [])],
+    }
+
 
 class HevyActivityImporter:
     """
@@ -43,7 +89,8 @@ class HevyActivityImporter:
     def import_workouts(
         self,
         start_date: date,
-        end_date: date
+        end_date: date,
+        verbose: bool = True
     ) -> Tuple[int, int, List[str]]:
         """
         Import workouts from Hevy for a date range.
@@ -51,6 +98,8 @@ class HevyActivityImporter:
         Args:
             start_date: Start date for import
             end_date: End date for import
+            verbose: Print a line per imported workout; otherwise only
+                per-batch progress and the summary are printed
 
         Returns:
             Tuple of (imported_count, skipped_count, error_messages)
@@ -64,79 +113,172 @@ class HevyActivityImporter:
         except Exception as e:
             return (0, 0, [f"Failed to fetch workouts: {e}"])
 
-        imported_count = 0
-        skipped_count = 0
-        errors = []
+        if not workouts:
+            return (0, 0, [])
 
+        # Hevy can return the same workout on more than one page; keep the
+        # first (newest-page) copy per ID. Workouts without an ID and
+        # duplicates count as skipped.
+        unique_workouts = {}
+        missing_count = 0
         for workout in workouts:
-            try:
-                workout_id = workout.get('id')
-                if not workout_id:
-                    errors.append("Workout missing ID, skipping")
-                    skipped_count += 1
-                    continue
+            workout_id = workout.get('id')
+            if workout_id:
+                unique_workouts.setdefault(workout_id, workout)
+            else:
+                missing_count += 1
 
+        imported_count = 0
+        skipped_count = len(workouts) - len(unique_workouts)
+        errors = ["Workout missing ID, skipping"] * missing_count
+        pending = []
+
+        # One query for every fetched workout that is already stored
+        existing_ids = set(self.db.scalars(
+            select(CompletedActivity.external_id).where(
+                CompletedActivity.athlete_id == self.athlete_id,
+                CompletedActivity.source == 'hevy',
+                CompletedActivity.external_id.in_({str(workout_id) for workout_id in unique_workouts})
+            )
+        ))
+
+        for workout_id, workout in unique_workouts.items():
+            try:
                 # Check if workout already exists
-                existing = self.db.query(CompletedActivity).filter(
-                    CompletedActivity.athlete_id == self.athlete_id,
-                    CompletedActivity.source == 'hevy',
-                    CompletedActivity.external_id == str(workout_id)
-                ).first()
-
-                if existing:
+                if str(workout_id) in existing_ids:
                     skipped_count += 1
                     continue
 
                 # Parse workout data
                 parsed_data = self._parse_hevy_workout(workout)
 
-                # Create database record
-                completed_activity = CompletedActivity(
-                    athlete_id=self.athlete_id,
-                    source='hevy',
-                    external_id=str(workout_id),
-                    activity_date=parsed_data['activity_date'],
-                    activity_time=parsed_data['activity_time'],
-                    activity_type='strength',
-                    activity_name=parsed_data['activity_name'],
-                    duration_minutes=parsed_data['duration_minutes'],
-                    activity_data=parsed_data['activity_data'],
-                )
-
-                self.db.add(completed_activity)
-                self.db.commit()
-                imported_count += 1
-
-                print(f"✓ Imported: {parsed_data['activity_name']} - {parsed_data['activity_date']}")
+                # Queue database row
+                pending.append({
+                    'athlete_id': self.athlete_id,
+                    'source': 'hevy',
+                    'external_id': str(workout_id),
+                    'activity_date': parsed_data['activity_date'],
+                    'activity_time': parsed_data['activity_time'],
+                    'activity_type': 'strength',
+                    'activity_name': parsed_data['activity_name'],
+                    'duration_minutes': parsed_data['duration_minutes'],
+                    'activity_data': parsed_data['activity_data'],
+                })
+                if len(pending) >= _COMMIT_BATCH_SIZE:
+                    committed = self._commit_batch(pending, errors, verbose)
+                    imported_count += committed
+                    skipped_count += len(pending) - committed
+                    pending = []
+                    if not verbose:
+                        print(f"Imported {imported_count}/{len(workouts)} workouts")
 
-            except IntegrityError as e:
-                self.db.rollback()
-                errors.append(f"Duplicate workout {workout_id}: {e}")
-                skipped_count += 1
             except Exception as e:
-                self.db.rollback()
-                errors.append(f"Error importing workout {workout.get('id')}: {e}")
+                errors.append(f"Error importing workout {workout_id}: {e}")
                 skipped_count += 1
 
+        if pending:
+            committed = self._commit_batch(pending, errors, verbose)
+            imported_count += committed
+            skipped_count += len(pending) - committed
+
         print(f"\nImport complete: {imported_count} imported, {skipped_count} skipped")
         if errors:
             print(f"Errors: {len(errors)}")
 
         return (imported_count, skipped_count, errors)
 
-    def import_recent_workouts(self, days: int = 7) -> Tuple[int, int, List[str]]:
+    def _insert_activities(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        INSERT new activity rows.
+
+        On PostgreSQL and SQLite, rows that already exist (e.g. stored by a
+        concurrent import) are skipped with ON CONFLICT DO NOTHING rather than
+        failing the whole statement. That needs RETURNING over executemany
+        (SQLite 3.35+), so older builds use the plain INSERT path.
+
+        Args:
+            rows: CompletedActivity column values, one dict per activity
+
+        Returns:
+            External IDs of the rows actually inserted
+        """
+        dialect = self.db.get_bind().dialect
+        dialect_insert = _CONFLICT_INSERTS.get(dialect.name)
+        if dialect_insert is None or not dialect.insert_executemany_returning:
+            self.db.execute(insert(CompletedActivity), rows)
+            return [row['external_id'] for row in rows]
+
+        stmt = dialect_insert(CompletedActivity).on_conflict_do_nothing(
+            index_elements=['athlete_id', 'source', 'external_id']
+        ).returning(CompletedActivity.external_id)
+        return self.db.scalars(stmt, rows).all()
+
+    def _commit_batch(self, rows: List[Dict[str, Any]], errors: List[str], verbose: bool = True) -> int:
+        """
+        Insert and commit a batch of new activities in a single transaction.
+
+        If the batch fails, it is rolled back and retried one activity at a
+        time so a single bad row doesn't drop the rest.
+
+        Args:
+            rows: CompletedActivity column values, one dict per activity
+            errors: Error list to append per-activity failures to
+            verbose: Print a line per committed activity
+
+        Returns:
+            Number of activities committed
+        """
+        labels = {
+            row['external_id']: f"{row['activity_name']} - {row['activity_date']}" for row in rows
+        } if verbose else None
+
+        try:
+            inserted = self._insert_activities(rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+        else:
+            if verbose:
+                for external_id in inserted:
+                    print(f"✓ Imported: {labels[external_id]}")
+            return len(inserted)
+
+        committed = 0
+        for row in rows:
+            external_id = row['external_id']
+            try:
+                inserted = self._insert_activities([row])
+                self.db.commit()
+            except IntegrityError as e:
+                self.db.rollback()
+                errors.append(f"Duplicate workout {external_id}: {e}")
+                continue
+            except Exception as e:
+                self.db.rollback()
+                errors.append(f"Error importing workout {external_id}: {e}")
+                continue
+
+            if inserted:
+                committed += 1
+                if verbose:
+                    print(f"✓ Imported: {labels[external_id]}")
+
+        return committed
+
+    def import_recent_workouts(self, days: int = 7, verbose: bool = True) -> Tuple[int, int, List[str]]:
         """
         Import workouts from the last N days.
 
         Args:
             days: Number of days to look back
+            verbose: Print a line per imported workout
 
         Returns:
             Tuple of (imported_count, skipped_count, error_messages)
         """
         end_date = date.today()
         start_date = date.today() - timedelta(days=days)
-        return self.import_workouts(start_date, end_date)
+        return self.import_workouts(start_date, end_date, verbose=verbose)
 
     def _parse_hevy_workout(self, workout: dict) -> dict:
         """
@@ -159,55 +301,19 @@ class HevyActivityImporter:
         duration_minutes = None
 
         if start_time and end_time:
-            if isinstance(start_time, str):
-                start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            else:
-                start_dt = start_time
-
-            if isinstance(end_time, str):
-                end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            else:
-                end_dt = end_time
-
-            duration = end_dt - start_dt
+            duration = _parse_timestamp(end_time) - _parse_timestamp(start_time)
             duration_minutes = int(duration.total_seconds() / 60)
 
         # Parse exercises
-        exercises_data = []
-        exercises = workout.get('exercises', [])
-        total_volume_lbs = 0
-
-        for exercise in exercises:
-            exercise_name = exercise.get('title', 'Unknown Exercise')
-            exercise_data = {
-                'exercise_name': exercise_name,
-                'exercise_type': exercise.get('exercise_type'),
-                'equipment_type': exercise.get('equipment_type'),
-                'muscle_group': exercise.get('muscle_group'),
-                'sets': []
-            }
-
-            # Parse sets
-            sets = exercise.get('sets', [])
-            for set_info in sets:
-                set_data = {
-                    'set_number': set_info.get('set_index', 0) + 1,
-                    'reps': set_info.get('reps'),
-                    'weight_lbs': set_info.get('weight_lbs'),
-                    'weight_kg': set_info.get('weight_kg'),
-                    'rpe': set_info.get('rpe'),
-                    'distance_meters': set_info.get('distance_meters'),
-                    'duration_seconds': set_info.get('duration_seconds'),
-                }
-
-                # Calculate volume (weight * reps)
-                if set_data['weight_lbs'] and set_data['reps']:
-                    set_volume = set_data['weight_lbs'] * set_data['reps']
-                    total_volume_lbs += set_volume
-
-                exercise_data['sets'].append(set_data)
-
-            exercises_data.append(exercise_data)
+        exercises_data = [_build_exercise(exercise) for exercise in workout.get('exercises', [])]
+
+        # Calculate volume (weight * reps)
+        total_volume_lbs = sum(
+            set_data['weight_lbs'] * set_data['reps']
+            for exercise_data in exercises_data
+            for set_data in exercise_data['sets']
+            if set_data['weight_lbs'] and set_data['reps']
+        )
 
         # Compile activity data
         activity_data = {
@@ -226,5 +332,5 @@ class HevyActivityImporter:
             'activity_time': workout_time,
             'activity_name': workout_title,
             'duration_minutes': duration_minutes,
-            'activity_data': json.dumps(activity_data),
+            'activity_data': to_json(activity_data),
         }
@@ -3,9 +3,13 @@ Hevy API client wrapper.
 Uses the hevy-api-client library to interact with Hevy's API.
 """
 
+import copy
 import os
-from typing import Optional, List, Dict, Any
-from datetime import date, datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
 
 try:
@@ -19,12 +23,28 @@ except ImportError:
 
 load_dotenv()
 
+# hevy-api-client's Client holds a keep-alive httpx connection pool, so one is
+# shared per process instead of opening fresh TLS connections per HevyClient
+_SHARED_CLIENT = Client() if HEVY_AVAILABLE else None
+
+# Fetched workout pages: (api_key, page, page_size) -> (expires_at, workouts).
+# Only the newest pages usually change, so older pages are kept longer.
+_PAGE_CACHE: Dict[Tuple[str, int, int], Tuple[float, List[Dict[str, Any]]]] = {}
+# Last page_count Hevy reported: (api_key, page_size) -> page_count
+_PAGE_COUNTS: Dict[Tuple[str, int], int] = {}
+_PAGE_CACHE_LOCK = threading.Lock()
+RECENT_PAGE_TTL = 60  # seconds; page 1 and pages with workouts from the last day
+HISTORICAL_PAGE_TTL = 60 * 60  # seconds; pages of older workouts (edits/deletes show up within the hour)
+
 
 class HevyClient:
     """
     Wrapper around hevy-api-client for easier use in our application.
     """
 
+    # Workout pages requested concurrently by get_all_workouts
+    PAGE_FETCH_WORKERS = 4
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Hevy client.
@@ -46,14 +66,17 @@ class HevyClient:
         # Store API key as string for headers
         self.api_key = self.api_key_str
 
-        # Create the client
-        self.client = Client()
+        # Reuse the process-wide client (and its open connections)
+        self.client = _SHARED_CLIENT
         print(f"Initialized Hevy API client")
 
     def get_workouts(self, page: int = 1, page_size: int = 10) -> List[Dict[str, Any]]:
         """
         Get workouts from Hevy.
 
+        Pages are cached in-process (see _cache_page), so repeated syncs
+        only go back to the API for pages that may have changed.
+
         Args:
             page: Page number (1-indexed)
             page_size: Number of workouts per page
@@ -61,6 +84,11 @@ class HevyClient:
         Returns:
             List of workout dictionaries
         """
+        cached = _PAGE_CACHE.get((self.api_key, page, page_size))
+        if cached and cached[0] > time.monotonic():
+            # Callers get their own copy so edits can't leak into the cache
+            return copy.deepcopy(cached[1])
+
         try:
             response = get_v1_workouts.sync(
                 client=self.client,
@@ -69,23 +97,104 @@ class HevyClient:
                 api_key=self.api_key
             )
 
+            workouts = []
             if response and hasattr(response, 'workouts') and not isinstance(response.workouts, type(UNSET)):
                 # Convert Workout objects to dictionaries
-                workouts = []
                 for workout in response.workouts:
                     workout_dict = self._workout_to_dict(workout)
                     workouts.append(workout_dict)
-                return workouts
-            return []
+
+            page_count = getattr(response, 'page_count', None)
 
         except Exception as e:
             print(f"Error fetching workouts: {e}")
             raise
 
+        self._cache_page(page, page_size, workouts, page_count if isinstance(page_count, int) else None)
+        return workouts
+
+    def _cache_page(
+        self,
+        page: int,
+        page_size: int,
+        workouts: List[Dict[str, Any]],
+        page_count: Optional[int] = None
+    ) -> None:
+        """
+        Store a copy of a fetched page in the page cache.
+
+        Page 1 and pages holding workouts from the last day get
+        RECENT_PAGE_TTL; older pages get HISTORICAL_PAGE_TTL. Hevy pages by
+        offset, so when page 1 comes back with different workouts or the
+        reported page count changes, later pages have shifted and all cached
+        pages for this key and page size are dropped.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of workouts per page
+            workouts: Workout dictionaries for the page
+            page_count: Total pages reported with the page, if known
+        """
+        ttl = RECENT_PAGE_TTL
+        if page > 1:
+            dates = [workout['date'] for workout in workouts if workout.get('date')]
+            if dates and max(dates) < date.today() - timedelta(days=1):
+                ttl = HISTORICAL_PAGE_TTL
+
+        entry = (time.monotonic() + ttl, copy.deepcopy(workouts))
+
+        with _PAGE_CACHE_LOCK:
+            count_key = (self.api_key, page_size)
+            shifted = page_count is not None and _PAGE_COUNTS.get(count_key, page_count) != page_count
+            if page == 1 and not shifted:
+                previous = _PAGE_CACHE.get((self.api_key, 1, page_size))
+                shifted = bool(previous) and [w.get('id') for w in previous[1]] != [w.get('id') for w in workouts]
+
+            if shifted:
+                for key in [k for k in _PAGE_CACHE if k[0] == self.api_key and k[2] == page_size]:
+                    del _PAGE_CACHE[key]
+            if page_count is not None:
+                _PAGE_COUNTS[count_key] = page_count
+            _PAGE_CACHE[(self.api_key, page, page_size)] = entry
+
+    def _iter_pages(self, page_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield workout pages in order, newest first, ending after the first
+        short (or empty) page.
+
+        Page 1 is fetched on its own first so that a change there clears
+        shifted pages from the cache before they are read. Later pages are
+        fetched PAGE_FETCH_WORKERS at a time.
+
+        Args:
+            page_size: Number of workouts per page
+        """
+        workouts = self.get_workouts(page=1, page_size=page_size)
+        yield workouts
+        if len(workouts) < page_size:
+            return
+
+        page = 2
+        with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_WORKERS) as executor:
+            while True:
+                pages = executor.map(
+                    lambda p: self.get_workouts(page=p, page_size=page_size),
+                    range(page, page + self.PAGE_FETCH_WORKERS)
+                )
+                for workouts in pages:
+                    yield workouts
+                    # Fewer than page_size means this was the last page
+                    if len(workouts) < page_size:
+                        return
+                page += self.PAGE_FETCH_WORKERS
+
     def get_all_workouts(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Dict[str, Any]]:
         """
         Get all workouts, optionally filtered by date range.
 
+        Pages are processed in order (see _iter_pages), stopping at the
+        first page that reaches start_date or runs out.
+
         Args:
             start_date: Optional start date filter
             end_date: Optional end date filter
@@ -94,23 +203,15 @@ class HevyClient:
             List of workout dictionaries
         """
         all_workouts = []
-        page = 1
         page_size = 10  # Hevy API has a page size limit
 
         try:
-            while True:
-                workouts = self.get_workouts(page=page, page_size=page_size)
-
-                if not workouts:
-                    break
-
-                # Filter by date if specified
+            for workouts in self._iter_pages(page_size):
+                # Filter by date if specified ('date' is already a date,
+                # parsed once by _workout_to_dict)
                 for workout in workouts:
                     workout_date = workout.get('date')
                     if workout_date:
-                        if isinstance(workout_date, str):
-                            workout_date = datetime.fromisoformat(workout_date.replace('Z', '+00:00')).date()
-
                         # Workouts are sorted newest first
                         # If we're past the start_date, we can stop
                         if start_date and workout_date < start_date:
@@ -120,18 +221,8 @@ class HevyClient:
                         if end_date and workout_date > end_date:
                             continue
 
-                        # Skip if before start_date
-                        if start_date and workout_date < start_date:
-                            continue
-
                     all_workouts.append(workout)
 
-                # Check if we got fewer than page_size (last page)
-                if len(workouts) < page_size:
-                    break
-
-                page += 1
-
                 # Safety check
                 if len(all_workouts) > 1000:
                     print("Warning: Retrieved over 1000 workouts, stopping")
@@ -200,7 +291,8 @@ class HevyClient:
                 # Unix timestamp
                 dt = datetime.fromtimestamp(start_time)
             elif isinstance(start_time, str):
-                dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                # fromisoformat reads the trailing 'Z' itself
+                dt = datetime.fromisoformat(start_time)
             else:
                 dt = start_time
             workout_dict['date'] = dt.date() if hasattr(dt, 'date') else None
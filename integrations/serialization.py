@@ -0,0 +1,26 @@
+"""
+JSON serialization shared by the importers.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def to_json(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize to JSON, using orjson's C encoder when it is installed.
+
+    Values JSON can't represent (dates, Decimals) are written with str(), and
+    non-string dict keys are allowed, on both paths. Pass sort_keys=True when
+    the output is hashed so equal data always encodes to the same string.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, default=str)
@@ -12,6 +12,7 @@ import os
 import sys
 import json
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = os.getenv("BASE_URL", "https://training.ryanwillging.com")
 SNAPSHOT_DIR = Path(__file__).parent.parent / "tests" / "snapshots"
@@ -38,12 +40,18 @@ ENDPOINTS = [
     ("/api/reports/weekly", "html", None),
 ]
 
+# Every endpoint is on the same host, so one keep-alive session saves a TLS
+# handshake per request; the pool is sized to hold a connection per endpoint
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=len(ENDPOINTS)))
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=len(ENDPOINTS)))
+
 
 def get_response(path: str):
     """Fetch a response from the API."""
     url = f"{BASE_URL}{path}"
     try:
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         return {
             "status_code": response.status_code,
             "content_type": response.headers.get("content-type", ""),
@@ -54,6 +62,12 @@ def get_response(path: str):
         return {"error": str(e)}
 
 
+def get_responses(paths):
+    """Fetch responses for several paths concurrently, keyed by path."""
+    with ThreadPoolExecutor(max_workers=len(paths) or 1) as executor:
+        return dict(zip(paths, executor.map(get_response, paths)))
+
+
 def hash_html_structure(html: str) -> str:
     """Create a hash of HTML structure (ignoring dynamic content)."""
     import re
@@ -78,9 +92,12 @@ def capture_snapshots():
 
     print(f"Capturing snapshots from {BASE_URL}...\n")
 
+    # Fetch everything up front; results are reported in endpoint order below
+    responses = get_responses([path for path, _, _ in ENDPOINTS])
+
     for path, expected_type, key_fields in ENDPOINTS:
         print(f"  {path}...", end=" ")
-        response = get_response(path)
+        response = responses[path]
 
         if "error" in response:
             print(f"ERROR: {response['error']}")
@@ -134,6 +151,13 @@ def verify_snapshots():
     passed = 0
     failed = 0
 
+    # Fetch every endpoint with a usable snapshot up front; results are
+    # reported in endpoint order below
+    responses = get_responses([
+        path for path, _, _ in ENDPOINTS
+        if path in saved["endpoints"] and "error" not in saved["endpoints"][path]
+    ])
+
     for path, expected_type, key_fields in ENDPOINTS:
         print(f"  {path}...", end=" ")
 
@@ -146,7 +170,7 @@ def verify_snapshots():
             print(f"SKIP (saved had error)")
             continue
 
-        response = get_response(path)
+        response = responses[path]
         if "error" in response:
             print(f"FAIL (error: {response['error']})")
             failed += 1
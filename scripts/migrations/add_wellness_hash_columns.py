@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration script to add content_hash and raw_data_hash columns to daily_wellness table.
+Works with both SQLite (local) and PostgreSQL (production).
+
+Usage:
+    # Local (uses .env or defaults to SQLite):
+    python scripts/migrations/add_wellness_hash_columns.py
+
+    # Production (pass DATABASE_URL):
+    DATABASE_URL="postgresql://..." python scripts/migrations/add_wellness_hash_columns.py
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# Load dotenv BEFORE importing database module
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import text, inspect, create_engine
+
+
+# (column name, SQL type) pairs added by this migration
+NEW_COLUMNS = [
+    ("content_hash", "VARCHAR(32)"),
+    ("raw_data_hash", "VARCHAR(32)"),
+]
+
+
+def get_engine():
+    """Create engine based on DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./training.db")
+
+    # Convert postgres:// to postgresql://
+    if DATABASE_URL.startswith("postgres://"):
+        DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+
+    if DATABASE_URL.startswith("sqlite"):
+        return create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    elif DATABASE_URL.startswith("postgresql"):
+        connect_args = {}
+        if any(x in DATABASE_URL.lower() for x in ["vercel", "neon", "supabase", "railway"]):
+            connect_args["sslmode"] = "require"
+        return create_engine(DATABASE_URL, connect_args=connect_args)
+    else:
+        return create_engine(DATABASE_URL)
+
+
+def main():
+    print("Adding hash columns to daily_wellness table...")
+
+    engine = get_engine()
+
+    # Check database dialect
+    dialect = engine.dialect.name
+    print(f"Database: {dialect}")
+
+    with engine.connect() as conn:
+        inspector = inspect(engine)
+        columns = [c['name'] for c in inspector.get_columns('daily_wellness')]
+
+        for name, sql_type in NEW_COLUMNS:
+            if name in columns:
+                print(f"✓ Column {name} already exists")
+                continue
+
+            conn.execute(text(f"ALTER TABLE daily_wellness ADD COLUMN {name} {sql_type}"))
+            print(f"✓ Added {name} column to daily_wellness table")
+
+        conn.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Migration script to replace the daily_wellness (athlete_id, date) index with a
+descending-date index used by the "latest wellness record" lookup.
+Works with both SQLite (local) and PostgreSQL (production).
+
+Usage:
+    # Local (uses .env or defaults to SQLite):
+    python scripts/migrations/add_wellness_indexes.py
+
+    # Production (pass DATABASE_URL):
+    DATABASE_URL="postgresql://..." python scripts/migrations/add_wellness_indexes.py
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# Load dotenv BEFORE importing database module
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import text, create_engine
+
+
+# Statements are idempotent so the script can be re-run safely
+STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_wellness_athlete_date_desc ON daily_wellness (athlete_id, date DESC)",
+    "DROP INDEX IF EXISTS idx_wellness_date",
+]
+
+
+def get_engine():
+    """Create engine based on DATABASE_URL."""
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./training.db")
+
+    # Convert postgres:// to postgresql://
+    if DATABASE_URL.startswith("postgres://"):
+        DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+
+    if DATABASE_URL.startswith("sqlite"):
+        return create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    elif DATABASE_URL.startswith("postgresql"):
+        connect_args = {}
+        if any(x in DATABASE_URL.lower() for x in ["vercel", "neon", "supabase", "railway"]):
+            connect_args["sslmode"] = "require"
+        return create_engine(DATABASE_URL, connect_args=connect_args)
+    else:
+        return create_engine(DATABASE_URL)
+
+
+def main():
+    print("Updating daily_wellness indexes...")
+
+    engine = get_engine()
+
+    # Check database dialect
+    dialect = engine.dialect.name
+    print(f"Database: {dialect}")
+
+    with engine.connect() as conn:
+        for statement in STATEMENTS:
+            conn.execute(text(statement))
+            print(f"✓ {statement}")
+
+        conn.commit()
+
+
+if __name__ == "__main__":
+    main()
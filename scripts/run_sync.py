@@ -53,46 +53,58 @@ def run_sync():
         "hevy_imported": 0
     }
 
-    # Sync Garmin wellness data
+    # One authenticated Garmin session shared by the wellness and activity importers;
+    # if it can't be built, both are skipped instead of each retrying the login
+    garmin_client = None
     try:
-        from integrations.garmin.wellness_importer import GarminWellnessImporter
-        print(f"\nSyncing Garmin wellness data for last {days} days...")
-        importer = GarminWellnessImporter(db, athlete_id)
-        imported = 0
-        for i in range(days):
-            target_date = end_date - timedelta(days=i)
-            success, msg = importer.import_wellness_for_date(target_date)
-            if success:
-                imported += 1
-            print(f"  {target_date}: {msg}")
-        results["garmin_wellness"] = f"{imported} days imported"
-        results["garmin_wellness_imported"] = imported
-        print(f"Wellness sync complete: {imported} days")
+        from integrations.garmin.client import GarminClient
+        garmin_client = GarminClient()
     except Exception as e:
-        error = f"Garmin wellness sync failed: {str(e)}"
+        error = f"Garmin client unavailable: {str(e)}"
         results["errors"].append(error)
         print(error)
-        import traceback
-        traceback.print_exc()
 
-    # Sync Garmin activities
-    try:
-        from integrations.garmin.activity_importer import GarminActivityImporter
-        print(f"\nSyncing Garmin activities for last {days} days...")
-        importer = GarminActivityImporter(db, athlete_id)
-        imported, skipped, errors = importer.import_activities(start_date, end_date)
-        results["garmin_activities"] = f"{imported} imported, {skipped} skipped"
-        results["garmin_activities_imported"] = imported
-        print(f"Activity sync complete: {imported} imported, {skipped} skipped")
-        if errors:
-            for err in errors:
-                print(f"  Error: {err}")
-    except Exception as e:
-        error = f"Garmin activity sync failed: {str(e)}"
-        results["errors"].append(error)
-        print(error)
-        import traceback
-        traceback.print_exc()
+    if garmin_client is not None:
+        # Sync Garmin wellness data
+        try:
+            from integrations.garmin.wellness_importer import GarminWellnessImporter, ImportStatus
+            print(f"\nSyncing Garmin wellness data for last {days} days...")
+            importer = GarminWellnessImporter(db, athlete_id, client=garmin_client)
+            imported = 0
+            for i in range(days):
+                target_date = end_date - timedelta(days=i)
+                status, msg = importer.import_wellness_for_date(target_date)
+                if status != ImportStatus.ERROR:
+                    imported += 1
+                print(f"  {target_date}: {msg}")
+            results["garmin_wellness"] = f"{imported} days imported"
+            results["garmin_wellness_imported"] = imported
+            print(f"Wellness sync complete: {imported} days")
+        except Exception as e:
+            error = f"Garmin wellness sync failed: {str(e)}"
+            results["errors"].append(error)
+            print(error)
+            import traceback
+            traceback.print_exc()
+
+        # Sync Garmin activities
+        try:
+            from integrations.garmin.activity_importer import GarminActivityImporter
+            print(f"\nSyncing Garmin activities for last {days} days...")
+            importer = GarminActivityImporter(db, athlete_id, client=garmin_client)
+            imported, skipped, errors = importer.import_activities(start_date, end_date)
+            results["garmin_activities"] = f"{imported} imported, {skipped} skipped"
+            results["garmin_activities_imported"] = imported
+            print(f"Activity sync complete: {imported} imported, {skipped} skipped")
+            if errors:
+                for err in errors:
+                    print(f"  Error: {err}")
+        except Exception as e:
+            error = f"Garmin activity sync failed: {str(e)}"
+            results["errors"].append(error)
+            print(error)
+            import traceback
+            traceback.print_exc()
 
     # Sync Hevy workouts
     try:
@@ -0,0 +1,34 @@
+"""
+Pytest configuration for unit tests.
+
+Each test gets a fresh in-memory SQLite database with one athlete.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.base import Base
+from database.models import Athlete
+
+
+ATHLETE_ID = 1
+
+
+@pytest.fixture
+def athlete_id():
+    """ID of the athlete created in the test database."""
+    return ATHLETE_ID
+
+
+@pytest.fixture
+def db():
+    """Session bound to an empty in-memory database containing one athlete."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Athlete(id=ATHLETE_ID, name="Test Athlete", goals="{}"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the HevyClient page cache.
+"""
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import integrations.hevy.client as hevy_client
+from integrations.hevy.client import HevyClient
+
+
+class FakeWorkoutsApi:
+    """Stands in for hevy_api_client's get_v1_workouts, paging over a list newest first."""
+
+    def __init__(self, workouts):
+        self.workouts = workouts
+        self.pages_requested = []
+
+    def sync(self, client, page, page_size, api_key):
+        self.pages_requested.append(page)
+        start = (page - 1) * page_size
+        return SimpleNamespace(
+            workouts=[dict(w) for w in self.workouts[start:start + page_size]],
+            page_count=-(-len(self.workouts) // page_size),
+        )
+
+
+class Unset:
+    """Placeholder for hevy_api_client.types.Unset."""
+
+
+def make_workouts(count, newest=date(2025, 12, 1)):
+    return [{"id": f"w{i}", "date": newest - timedelta(days=i), "exercises": []} for i in range(count)]
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeWorkoutsApi(make_workouts(25))
+    monkeypatch.setattr(hevy_client, "HEVY_AVAILABLE", True)
+    monkeypatch.setattr(hevy_client, "get_v1_workouts", fake, raising=False)
+    monkeypatch.setattr(hevy_client, "UNSET", Unset(), raising=False)
+    monkeypatch.setattr(hevy_client, "_PAGE_CACHE", {})
+    monkeypatch.setattr(hevy_client, "_PAGE_COUNTS", {})
+    monkeypatch.setattr(HevyClient, "_workout_to_dict", lambda self, workout: workout)
+    return fake
+
+
+@pytest.fixture
+def client(api):
+    return HevyClient(api_key="test-key")
+
+
+def expire_page(page, page_size=10):
+    key = ("test-key", page, page_size)
+    hevy_client._PAGE_CACHE[key] = (0, hevy_client._PAGE_CACHE[key][1])
+
+
+class TestPageCache:
+    """Cached pages are reused until page 1 or the page count shows a shift."""
+
+    def test_repeat_fetch_is_served_from_cache(self, client, api):
+        first = client.get_all_workouts()
+        api.pages_requested.clear()
+
+        assert client.get_all_workouts() == first
+        assert api.pages_requested == []
+
+    def test_changed_first_page_invalidates_later_pages(self, client, api):
+        client.get_all_workouts()
+        api.workouts.insert(0, {"id": "new", "date": date(2025, 12, 2), "exercises": []})
+        expire_page(1)
+        api.pages_requested.clear()
+
+        workouts = client.get_all_workouts()
+
+        # Every page is refetched, so the workout pushed off page 1 isn't lost
+        assert [w["id"] for w in workouts] == ["new"] + [f"w{i}" for i in range(25)]
+        assert api.pages_requested[0] == 1
+        assert {2, 3} <= set(api.pages_requested)
+
+    def test_changed_page_count_invalidates_later_pages(self, client, api):
+        client.get_all_workouts()
+        del api.workouts[20:]
+        expire_page(1)
+
+        workouts = client.get_all_workouts()
+
+        assert [w["id"] for w in workouts] == [f"w{i}" for i in range(20)]
+
+    def test_unchanged_first_page_keeps_later_pages(self, client, api):
+        client.get_all_workouts()
+        expire_page(1)
+        api.pages_requested.clear()
+
+        client.get_all_workouts()
+
+        assert api.pages_requested == [1]
+
+    def test_cached_pages_are_copies(self, client, api):
+        client.get_workouts(page=2)[0]["id"] = "edited"
+
+        assert client.get_workouts(page=2)[0]["id"] == "w10"
@@ -0,0 +1,94 @@
+"""
+Unit tests for HevyActivityImporter duplicate handling.
+"""
+
+from datetime import date
+
+import pytest
+
+import integrations.hevy.client as hevy_client
+from database.models import CompletedActivity
+from integrations.hevy.activity_importer import HevyActivityImporter
+
+
+def make_workout(workout_id, title="Push Day"):
+    """Workout dict in the shape HevyClient returns."""
+    return {
+        "id": workout_id,
+        "title": title,
+        "date": date(2026, 1, 10),
+        "time": None,
+        "start_time": "2026-01-10T10:00:00Z",
+        "end_time": "2026-01-10T11:00:00Z",
+        "exercises": [{"title": "Bench Press", "sets": [{"set_index": 0, "reps": 5, "weight_lbs": 185.0}]}],
+    }
+
+
+class FakeHevyClient:
+    def __init__(self, workouts):
+        self.workouts = workouts
+
+    def get_all_workouts(self, start_date, end_date):
+        return self.workouts
+
+
+@pytest.fixture
+def importer(db, athlete_id, monkeypatch):
+    monkeypatch.setattr(hevy_client, "HEVY_AVAILABLE", True)
+    monkeypatch.setenv("HEVY_API_KEY", "test-key")
+    return HevyActivityImporter(db, athlete_id)
+
+
+def run_import(importer, workouts):
+    importer.client = FakeHevyClient(workouts)
+    return importer.import_workouts(date(2026, 1, 1), date(2026, 1, 31), verbose=False)
+
+
+def stored_ids(db):
+    return sorted(row.external_id for row in db.query(CompletedActivity))
+
+
+class TestDuplicateHandling:
+    """Workouts that are already stored are skipped, never errors."""
+
+    def test_reimport_skips_existing(self, importer, db):
+        run_import(importer, [make_workout("a"), make_workout("b")])
+
+        imported, skipped, errors = run_import(importer, [make_workout("a"), make_workout("c")])
+
+        assert (imported, skipped, errors) == (1, 1, [])
+        assert stored_ids(db) == ["a", "b", "c"]
+
+    def test_conflicting_insert_is_ignored(self, importer, db):
+        # A row stored after the existence prefetch (e.g. by a concurrent
+        # import) must hit ON CONFLICT DO NOTHING instead of failing the batch
+        run_import(importer, [make_workout("a")])
+        rows = [
+            {
+                "athlete_id": importer.athlete_id,
+                "source": "hevy",
+                "external_id": workout_id,
+                "activity_date": date(2026, 1, 10),
+                "activity_time": None,
+                "activity_type": "strength",
+                "activity_name": "Push Day",
+                "duration_minutes": 60,
+                "activity_data": "{}",
+            }
+            for workout_id in ("a", "b")
+        ]
+        errors = []
+
+        committed = importer._commit_batch(rows, errors, verbose=False)
+
+        assert committed == 1
+        assert errors == []
+        assert stored_ids(db) == ["a", "b"]
+
+    def test_duplicate_ids_in_fetch_keep_first_copy(self, importer, db):
+        workouts = [make_workout("a", title="Newest"), make_workout("a", title="Older")]
+
+        imported, skipped, errors = run_import(importer, workouts)
+
+        assert (imported, skipped, errors) == (1, 1, [])
+        assert db.query(CompletedActivity).one().activity_name == "Newest"
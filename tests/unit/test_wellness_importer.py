@@ -0,0 +1,77 @@
+"""
+Unit tests for GarminWellnessImporter change detection.
+"""
+
+from datetime import date
+
+import pytest
+
+pytest.importorskip("garminconnect")
+
+from database.models import DailyWellness
+from integrations.garmin.wellness_importer import GarminWellnessImporter, ImportStatus
+
+
+TARGET_DATE = date(2026, 1, 15)
+
+
+class FakeGarminClient:
+    """Serves fixed wellness payloads; sleep score can be changed between imports."""
+
+    def __init__(self):
+        self.sleep_score = 80
+
+    def get_sleep_data(self, date_str):
+        return {"dailySleepDTO": {"sleepTimeSeconds": 28800, "sleepScores": {"overall": {"value": self.sleep_score}}}}
+
+    def get_resting_heart_rate(self, date_str):
+        return {}
+
+    def get_user_summary(self, date_str):
+        return {"totalSteps": 9000, "restingHeartRate": 52}
+
+    def __getattr__(self, name):
+        # Every other wellness endpoint returns no data
+        if name.startswith("get_"):
+            return lambda date_str: {}
+        raise AttributeError(name)
+
+
+@pytest.fixture
+def importer(db, athlete_id):
+    return GarminWellnessImporter(db, athlete_id, client=FakeGarminClient())
+
+
+class TestWellnessChangeDetection:
+    """Re-importing a day only writes when the Garmin data changed."""
+
+    def test_first_import_creates_record(self, importer, db):
+        status, _ = importer.import_wellness_for_date(TARGET_DATE)
+
+        assert status == ImportStatus.CREATED
+        assert db.query(DailyWellness).count() == 1
+
+    def test_unchanged_data_is_skipped(self, importer, db):
+        importer.import_wellness_for_date(TARGET_DATE)
+        record = db.query(DailyWellness).one()
+        hashes = (record.content_hash, record.raw_data_hash)
+        updated_at = record.updated_at
+
+        status, message = importer.import_wellness_for_date(TARGET_DATE)
+
+        assert status == ImportStatus.NOCHANGE
+        assert "No change" in message
+        db.expire_all()
+        record = db.query(DailyWellness).one()
+        assert (record.content_hash, record.raw_data_hash) == hashes
+        assert record.updated_at == updated_at
+
+    def test_changed_data_is_updated(self, importer, db):
+        importer.import_wellness_for_date(TARGET_DATE)
+        importer.client.sleep_score = 65
+
+        status, _ = importer.import_wellness_for_date(TARGET_DATE)
+
+        assert status == ImportStatus.UPDATED
+        db.expire_all()
+        assert db.query(DailyWellness).one().sleep_score == 65
@@ -0,0 +1,41 @@
+"""
+Unit tests for GarminWorkoutManager's GET response cache.
+"""
+
+import pytest
+
+pytest.importorskip("garminconnect")
+
+from integrations.garmin.workout_manager import GarminWorkoutManager
+
+
+@pytest.fixture
+def manager():
+    # client is only used for login, which these tests never reach
+    return GarminWorkoutManager(client=object())
+
+
+class TestResponseCache:
+    """Cached GET responses are copies and never outlive an invalidation."""
+
+    def test_hit_returns_a_copy(self, manager):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"calendarItems": [{"id": 1}]}
+
+        manager._cached("calendar:2026:1", 300, fetch)["calendarItems"].append({"id": 2})
+        result = manager._cached("calendar:2026:1", 300, fetch)
+
+        assert result == {"calendarItems": [{"id": 1}]}
+        assert len(calls) == 1
+
+    def test_fetch_overlapping_invalidate_is_not_stored(self, manager):
+        def stale_fetch():
+            # An upload on another thread invalidates while this GET is in flight
+            manager._invalidate("workouts")
+            return ["stale"]
+
+        assert manager._cached("workouts", 30, stale_fetch) == ["stale"]
+        assert manager._cached("workouts", 30, lambda: ["fresh"]) == ["fresh"]